@@ -0,0 +1,8 @@
+-- 파트너 연락처 조회용 인덱스 (쿠폰 상세/삭제, 파트너 검색의 전화번호 목록)
+-- 기존 데이터베이스에 한 번 실행합니다. (실행 순서는 DEPLOYMENT.md의 '스키마 마이그레이션' 참고)
+-- (회원별 쿠폰 목록 인덱스는 coupons.deleted_at과 함께 002_coupons_deleted_at.sql에서 생성)
+
+-- 파트너 연락처 조회 (WHERE contact_account_type = ? AND account_id = ? ORDER BY phone_id)
+-- number까지 포함해 GROUP_CONCAT 서브쿼리가 테이블을 읽지 않도록 합니다.
+CREATE INDEX ix_phones_acct
+    ON phones (contact_account_type, account_id, phone_id, number);
@@ -0,0 +1,10 @@
+-- 쿠폰 삭제 여부 비정규화 (coupons.deleted_at)
+-- 목록 조회가 register_logs를 JOIN하지 않고 coupons만으로 삭제 여부를 판단할 수 있도록 합니다.
+-- register_logs.deleted_at과 같은 트랜잭션에서 함께 갱신됩니다.
+-- 회원별 쿠폰 목록 (WHERE register_id = ? AND deleted_at IS NULL ORDER BY created_at DESC, coupon_id DESC)은
+-- 지연 JOIN으로 페이지의 coupon_id(PK, 보조 인덱스에 자동 포함)만 이 인덱스에서 읽습니다.
+
+ALTER TABLE coupons
+    ADD COLUMN deleted_at DATETIME NULL,
+    ADD INDEX ix_coupons_reg_del_created (register_id, deleted_at, created_at);
+-- 기존 삭제 이력 반영은 배포 후 재실행이 필요하므로 002b_coupons_deleted_at_backfill.sql로 분리
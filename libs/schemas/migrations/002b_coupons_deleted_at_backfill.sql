@@ -0,0 +1,9 @@
+-- coupons.deleted_at 삭제 이력 반영 (register_logs.deleted_at -> coupons.deleted_at)
+-- 002_coupons_deleted_at.sql 직후에 한 번, 새 Coupon Service 배포가 끝난 뒤 한 번 더 실행합니다.
+-- 배포 전까지 이전 코드는 register_logs.deleted_at만 기록하므로, 그 사이에 삭제된 쿠폰은
+-- 두 번째 실행에서 반영됩니다. 이미 반영된 행은 건너뛰므로 여러 번 실행해도 안전합니다.
+UPDATE coupons c
+INNER JOIN register_logs rl ON c.register_log_id = rl.register_log_id
+SET c.deleted_at = rl.deleted_at
+WHERE rl.deleted_at IS NOT NULL
+  AND c.deleted_at IS NULL;
@@ -0,0 +1,6 @@
+-- 결제 사용 기록 목록 조회용 인덱스
+-- 회원 쿠폰(coupons.register_id)에서 use_logs로 JOIN할 때 coupon_id로 찾고
+-- used_at DESC 정렬에 필요한 값을 인덱스에서 바로 읽습니다.
+-- (coupons(register_id, deleted_at, created_at) 인덱스는 002_coupons_deleted_at.sql, phones 인덱스는 001_coupon_list_indexes.sql에 포함)
+CREATE INDEX idx_use_logs_coupon_used
+    ON use_logs (coupon_id, used_at DESC);
@@ -0,0 +1,14 @@
+-- 파트너/상품 키워드 검색용 인덱스
+-- 검색어는 부분 일치(LIKE '%검색어%')이므로 인덱스 탐색 범위를 좁힐 수는 없지만,
+-- 정렬 순서대로 인덱스만 읽으며 LIKE 조건을 평가해 테이블 접근과 filesort를 없앱니다.
+-- (FULLTEXT는 ngram 토큰 단위로 일치 여부가 달라져 기존 부분 일치 결과와 달라지므로 사용하지 않음)
+
+-- 파트너 상품 검색 (WHERE partner_id = ? AND product_name LIKE ? ORDER BY product_name)
+-- InnoDB 보조 인덱스에는 PK(product_id)가 자동으로 포함되어 인덱스만으로 처리합니다.
+CREATE INDEX ix_products_partner_name
+    ON products (partner_id, product_name);
+
+-- 파트너 검색 (WHERE partner_name LIKE ? ORDER BY partner_name)
+-- partner_name 순서대로 읽으며 phones는 ix_phones_acct(001_coupon_list_indexes.sql)로 JOIN합니다.
+CREATE INDEX ix_partner_users_name
+    ON partner_users (partner_name);
@@ -3,7 +3,7 @@ import re
 from datetime import datetime
 from typing import Callable
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from libs.common import KST_TIMEZONE, ensure_kst, now_kst
 from libs.schemas import Member, PartnerUser
@@ -318,8 +318,8 @@ class SQLAlchemyMemberRepository(_SQLRepositoryBase):
                         FROM `groups`
                         WHERE group_id IN :group_ids
                         """
-                    ),
-                    {"group_ids": tuple(group_ids)},
+                    ).bindparams(bindparam("group_ids", expanding=True)),
+                    {"group_ids": group_ids},
                 )
                 row = result.mappings().first()
                 valid_count = row["count"] if row else 0
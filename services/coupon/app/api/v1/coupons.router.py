@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Response, Security, status
 from fastapi.security import HTTPAuthorizationCredentials
-from fastapi_pagination import Page
 
 from libs.common import CurrentUser, security
 
@@ -16,6 +15,7 @@ from services.coupon.app.schemas.response import (
     CouponAddResponse,
     CouponDetailResponse,
     CouponListItem,
+    KeysetPage,
     PaymentQrResponse,
 )
 
@@ -23,11 +23,13 @@ from services.coupon.app.schemas.response import (
 router = APIRouter(prefix="/coupons", tags=["Coupons"])
 
 
-@router.get("", response_model=Page[CouponListItem])
+@router.get("", response_model=KeysetPage[CouponListItem])
 async def get_coupons(
     current_user: CurrentUser,
+    response: Response,
     page: int = 1,
     size: int = 10,
+    cursor: str | None = None,
     coupon_service: CouponService = Depends(get_coupon_service),
 ):
     """
@@ -39,17 +41,22 @@ async def get_coupons(
     **Query Parameters:**
     - `page`: 페이지 번호 (기본값: 1)
     - `size`: 페이지 크기 (기본값: 10)
+    - `cursor`: 다음 페이지 커서 (이전 응답의 `NEXT-CURSOR` 헤더 값, 지정 시 `page` 무시)
     
     **Response:**
     - HTTP 200 OK: 쿠폰 목록 반환 (사용한 쿠폰 포함)
+    - HTTP 400 Bad Request: 유효하지 않은 커서 (ERR-IVD-VALUE)
     - HTTP 401 Unauthorized: 인증 실패
     
     **응답 형식:**
     - `items`: 쿠폰 목록
-    - `total`: 전체 개수
-    - `page`: 현재 페이지
+    - `total`: 전체 개수 (커서로 조회하면 null)
+    - `page`: 현재 페이지 (커서로 조회하면 null)
     - `size`: 페이지 크기
-    - `pages`: 전체 페이지 수
+    - `pages`: 전체 페이지 수 (커서로 조회하면 null)
+    
+    **Response Headers:**
+    - `NEXT-CURSOR`: 다음 페이지 커서 (마지막 페이지이면 없음)
     """
     subject_type, subject_id = current_user
     
@@ -61,11 +68,21 @@ async def get_coupons(
         )
     
     # 쿠폰 목록 조회
-    result = await coupon_service.get_coupons_by_member(
-        member_id=subject_id,
-        page=page,
-        size=size,
-    )
+    try:
+        result, next_cursor = await coupon_service.get_coupons_by_member(
+            member_id=subject_id,
+            page=page,
+            size=size,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "ERR-IVD-VALUE"},
+        )
+    
+    if next_cursor is not None:
+        response.headers["NEXT-CURSOR"] = next_cursor
     
     return result
 
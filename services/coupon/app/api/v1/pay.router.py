@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
-from fastapi_pagination import Page
 
 from libs.common import CurrentUser
 
@@ -10,6 +9,7 @@ from services.coupon.app.schemas.request import (
     PaymentTransactionSchema,
 )
 from services.coupon.app.schemas.response import (
+    KeysetPage,
     PaymentLogItem,
     PaymentTransactionResponse,
 )
@@ -18,11 +18,13 @@ from services.coupon.app.schemas.response import (
 router = APIRouter(prefix="/payments", tags=["Payment"])
 
 
-@router.get("/log", response_model=Page[PaymentLogItem])
+@router.get("/log", response_model=KeysetPage[PaymentLogItem])
 async def get_payment_log(
     current_user: CurrentUser,
+    response: Response,
     page: int = 1,
     size: int = 10,
+    cursor: str | None = None,
     coupon_service: CouponService = Depends(get_coupon_service),
 ):
     """
@@ -34,17 +36,22 @@ async def get_payment_log(
     **Query Parameters:**
     - `page`: 페이지 번호 (기본값: 1)
     - `size`: 페이지 크기 (기본값: 10)
+    - `cursor`: 다음 페이지 커서 (이전 응답의 `NEXT-CURSOR` 헤더 값, 지정 시 `page` 무시)
     
     **Response:**
     - HTTP 200 OK: 사용 기록 목록 반환
+    - HTTP 400 Bad Request: 유효하지 않은 커서 (ERR-IVD-VALUE)
     - HTTP 401 Unauthorized: 인증 실패
     
     **응답 형식:**
     - `items`: 사용 로그 목록
-    - `total`: 전체 개수
-    - `page`: 현재 페이지
+    - `total`: 전체 개수 (커서로 조회하면 null)
+    - `page`: 현재 페이지 (커서로 조회하면 null)
     - `size`: 페이지 크기
-    - `pages`: 전체 페이지 수
+    - `pages`: 전체 페이지 수 (커서로 조회하면 null)
+    
+    **Response Headers:**
+    - `NEXT-CURSOR`: 다음 페이지 커서 (마지막 페이지이면 없음)
     """
     subject_type, subject_id = current_user
     
@@ -56,11 +63,21 @@ async def get_payment_log(
         )
     
     # 결제 로그 조회
-    result = await coupon_service.get_payment_logs_by_member(
-        member_id=subject_id,
-        page=page,
-        size=size,
-    )
+    try:
+        result, next_cursor = await coupon_service.get_payment_logs_by_member(
+            member_id=subject_id,
+            page=page,
+            size=size,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "ERR-IVD-VALUE"},
+        )
+    
+    if next_cursor is not None:
+        response.headers["NEXT-CURSOR"] = next_cursor
     
     return result
 
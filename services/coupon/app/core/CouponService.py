@@ -1,14 +1,15 @@
 """
 쿠폰 관련 비즈니스 로직을 처리하는 서비스
 """
+import base64
+from datetime import datetime
 from typing import Protocol
 
-from fastapi_pagination import Page
-
 from services.coupon.app.schemas.response import (
     CouponAddResponse,
     CouponDetailResponse,
     CouponListItem,
+    KeysetPage,
     IssueCouponsResponse,
     IssueInfo,
     IssueListItem,
@@ -35,6 +36,64 @@ from services.coupon.app.schemas.response import (
     PartnerInfoInRequest,
 )
 
+__all__ = ["CouponService", "CouponRepositoryPort"]
+
+
+# 오류 코드 (라우터에서 str(e)로 비교하여 HTTP 응답으로 변환)
+_ERR_IVD_VALUE = "ERR-IVD-VALUE"
+_ERR_NOT_YOURS = "ERR-NOT-YOURS"
+_ERR_NOT_DECIDED = "ERR-NOT-DECIDED"
+_ERR_ALREADY_USED = "ERR-ALREADY-USED"
+
+# 목록 응답 항목 생성자 (Repository에서 정제된 값을 그대로 사용하므로 검증 생략)
+_build_coupon_list_item = CouponListItem.model_construct
+_build_payment_log_item = PaymentLogItem.model_construct
+_build_payment_log_coupon_info = PaymentLogCouponInfo.model_construct
+
+# 커서(keyset) 페이지네이션 토큰 형식: base64("ISO 8601 정렬 기준 일시|행 ID")
+# 커서에는 위치만 담고 전체 개수 등 서버가 계산하는 값은 담지 않음 (클라이언트가 조작 가능)
+_CURSOR_SEPARATOR = "|"
+
+
+def _encode_cursor(keyset: tuple[datetime, int]) -> str:
+    """마지막 행의 (정렬 기준 일시, 행 ID)로 불투명 커서 토큰을 생성합니다."""
+    sort_at, row_id = keyset
+    raw = f"{sort_at.isoformat()}{_CURSOR_SEPARATOR}{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    커서 토큰을 (정렬 기준 일시, 행 ID)로 복원합니다.
+    
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우 ("ERR-IVD-VALUE")
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_at, row_id = raw.split(_CURSOR_SEPARATOR)
+        return datetime.fromisoformat(sort_at), int(row_id)
+    except ValueError:
+        # base64/UTF-8 디코딩 오류도 ValueError의 하위 클래스
+        raise ValueError(_ERR_IVD_VALUE) from None
+
+
+def _build_keyset_page(items: list, total: int | None, page: int, size: int, cursor: str | None) -> KeysetPage:
+    """
+    목록 응답 페이지를 생성합니다.
+    
+    커서로 조회한 페이지는 전체 개수를 집계하지 않고 요청의 page도 의미가 없으므로 total, page, pages를 비웁니다.
+    """
+    if cursor is not None:
+        return KeysetPage(items=items, total=None, page=None, size=size, pages=None)
+    return KeysetPage(
+        items=items,
+        total=total,
+        page=page,
+        size=size,
+        pages=(total + size - 1) // size if size > 0 else 0,
+    )
+
 
 class CouponRepositoryPort(Protocol):
     """쿠폰 Repository 인터페이스"""
@@ -44,8 +103,183 @@ class CouponRepositoryPort(Protocol):
         member_id: int,
         page: int,
         size: int,
+        cursor: tuple[datetime, int] | None = None,
+    ) -> tuple[list[dict], int | None, tuple[datetime, int] | None]:
+        """
+        회원 ID로 쿠폰 목록을 조회합니다 (페이징 지원).
+        
+        Args:
+            member_id: 회원 ID
+            page: 페이지 번호 (1부터 시작, cursor가 있으면 무시)
+            size: 페이지 크기
+            cursor: 이전 페이지 마지막 쿠폰의 (생성 일시, 쿠폰 ID) (keyset 페이지네이션)
+        
+        Returns:
+            (쿠폰 목록, 전체 개수, 다음 페이지 keyset) 튜플
+            - cursor로 조회하면 전체 개수를 집계하지 않고 None을 반환
+            - 다음 페이지가 있으면 마지막 쿠폰의 (생성 일시, 쿠폰 ID), 없으면 None
+        """
+        ...
+    
+    async def find_coupon_by_id(
+        self,
+        coupon_id: int,
+    ) -> dict | None:
+        """
+        쿠폰 ID로 쿠폰 상세 정보를 조회합니다.
+        
+        Args:
+            coupon_id: 쿠폰 ID
+        
+        Returns:
+            쿠폰 상세 정보 딕셔너리 또는 None
+        """
+        ...
+    
+    async def mark_coupons_as_deleted(
+        self,
+        coupon_ids: list[int],
+        member_id: int,
     ) -> tuple[list[dict], int]:
-        """회원 ID로 쿠폰 목록을 조회합니다"""
+        """
+        쿠폰들을 삭제 처리합니다 (register_logs와 coupons에 deleted_at 기록).
+        본인이 등록한 쿠폰인지 함께 검증하며, 삭제된 쿠폰 중 사용하지 않은 쿠폰의 상세 정보를 반환합니다.
+        
+        Args:
+            coupon_ids: 삭제할 쿠폰 ID 목록
+            member_id: 회원 ID
+        
+        Returns:
+            (삭제된 쿠폰 중 사용하지 않은 쿠폰의 상세 정보 목록, 유효하지 않은 쿠폰 개수) 튜플
+            - 유효하지 않은 쿠폰이 있으면 아무것도 삭제하지 않고 빈 목록을 반환
+        """
+        ...
+    
+    async def find_payment_logs_by_member_id(
+        self,
+        member_id: int,
+        page: int,
+        size: int,
+        cursor: tuple[datetime, int] | None = None,
+    ) -> tuple[list[dict], int | None, tuple[datetime, int] | None]:
+        """
+        회원 ID로 결제된 쿠폰의 사용 기록을 조회합니다 (페이징 지원).
+        
+        Args:
+            member_id: 회원 ID
+            page: 페이지 번호 (1부터 시작, cursor가 있으면 무시)
+            size: 페이지 크기
+            cursor: 이전 페이지 마지막 로그의 (사용 일시, 사용 로그 ID) (keyset 페이지네이션)
+        
+        Returns:
+            (사용 로그 목록, 전체 개수, 다음 페이지 keyset) 튜플
+            - cursor로 조회하면 전체 개수를 집계하지 않고 None을 반환
+            - 다음 페이지가 있으면 마지막 로그의 (사용 일시, 사용 로그 ID), 없으면 None
+        """
+        ...
+    
+    async def find_coupon_by_registration_code(
+        self,
+        registration_code: str,
+    ) -> dict | None:
+        """
+        등록코드로 쿠폰을 조회합니다.
+        
+        Args:
+            registration_code: 쿠폰 등록 코드
+        
+        Returns:
+            쿠폰 정보 딕셔너리 또는 None
+        """
+        ...
+    
+    async def register_coupon(
+        self,
+        coupon_id: int,
+        member_id: int,
+        registration_code: str,
+        signature_code: str,
+    ) -> None:
+        """
+        쿠폰을 회원에게 등록합니다.
+        
+        Args:
+            coupon_id: 쿠폰 ID
+            member_id: 회원 ID
+            registration_code: 등록 코드 (검증용)
+            signature_code: 서명 이미지 코드
+        """
+        ...
+    
+    async def find_coupon_by_id_for_payment_qr(
+        self,
+        coupon_id: int,
+        member_id: int,
+    ) -> dict | None:
+        """
+        결제 QR 생성을 위한 쿠폰 정보를 조회합니다 (소유권 확인 포함).
+        
+        Args:
+            coupon_id: 쿠폰 ID
+            member_id: 회원 ID (소유권 확인용)
+        
+        Returns:
+            쿠폰 정보 딕셔너리 또는 None
+            - coupon_id: 쿠폰 ID
+            - registration_code: 결제코드
+            - register_id: 등록자 ID
+            - use_log_id: 사용 로그 ID
+            - expired_at: 쿠폰 만료 일시
+        """
+        ...
+    
+    async def expire_payment_qr_by_coupon_id(
+        self,
+        coupon_id: int,
+    ) -> None:
+        """
+        특정 쿠폰의 모든 활성 QR 코드를 만료 처리합니다.
+        
+        Args:
+            coupon_id: 쿠폰 ID
+        """
+        ...
+    
+    async def create_payment_qr(
+        self,
+        coupon_id: int,
+        payment_code: str,
+        expired_at: datetime,
+    ) -> int:
+        """
+        결제 QR 코드를 생성합니다.
+        
+        Args:
+            coupon_id: 쿠폰 ID
+            payment_code: 결제코드 (registration_code)
+            expired_at: 만료 일시
+        
+        Returns:
+            생성된 결제 QR 코드 ID
+        """
+        ...
+    
+    async def find_active_payment_qr_by_coupon_id(
+        self,
+        coupon_id: int,
+    ) -> dict | None:
+        """
+        활성 결제 QR 코드를 조회합니다.
+        
+        Args:
+            coupon_id: 쿠폰 ID
+        
+        Returns:
+            결제 QR 코드 정보 딕셔너리 또는 None
+            - payment_qr_id: 결제 QR 코드 ID
+            - payment_code: 결제코드
+            - expired_at: 만료 일시
+        """
         ...
 
 
@@ -60,27 +294,35 @@ class CouponService:
         member_id: int,
         page: int,
         size: int,
-    ) -> Page[CouponListItem]:
+        cursor: str | None = None,
+    ) -> tuple[KeysetPage[CouponListItem], str | None]:
         """
         회원의 쿠폰 목록을 조회합니다.
         
         Args:
             member_id: 회원 ID
-            page: 페이지 번호 (1부터 시작)
+            page: 페이지 번호 (1부터 시작, 커서가 없을 때 사용하는 호환용 OFFSET 방식)
             size: 페이지 크기
+            cursor: 이전 응답의 다음 페이지 커서 토큰
             
         Returns:
-            페이징된 쿠폰 목록
+            (페이징된 쿠폰 목록, 다음 페이지 커서 토큰) 튜플 (마지막 페이지이면 커서는 None)
+            - 커서로 조회한 페이지는 total, page, pages가 None
+        
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우 ("ERR-IVD-VALUE")
         """
-        coupons_data, total = await self.coupon_repository.find_coupons_by_member_id(
+        coupons_data, total, next_keyset = await self.coupon_repository.find_coupons_by_member_id(
             member_id=member_id,
             page=page,
             size=size,
+            cursor=_decode_cursor(cursor) if cursor is not None else None,
         )
         
-        # 딕셔너리를 CouponListItem으로 변환
+        # 딕셔너리를 CouponListItem으로 변환 (행마다 전역 조회를 하지 않도록 생성자를 지역 변수로 바인딩)
+        build_item = _build_coupon_list_item
         items = [
-            CouponListItem(
+            build_item(
                 couponId=item["coupon_id"],
                 productName=item["product_name"],
                 partnerName=item["partner_name"],
@@ -92,14 +334,8 @@ class CouponService:
             for item in coupons_data
         ]
         
-        # fastapi-pagination의 Page 객체 생성
-        return Page(
-            items=items,
-            total=total,
-            page=page,
-            size=size,
-            pages=(total + size - 1) // size if size > 0 else 0,
-        )
+        next_cursor = _encode_cursor(next_keyset) if next_keyset is not None else None
+        return _build_keyset_page(items, total, page, size, cursor), next_cursor
     
     async def get_coupon_detail(
         self,
@@ -122,11 +358,11 @@ class CouponService:
         coupon_data = await self.coupon_repository.find_coupon_by_id(coupon_id)
         
         if coupon_data is None:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 본인이 등록한 쿠폰인지 확인
         if coupon_data["register_id"] != member_id:
-            raise ValueError("ERR-NOT-YOURS")
+            raise ValueError(_ERR_NOT_YOURS)
         
         # 파트너 정보
         partner = PartnerInfo(
@@ -143,21 +379,18 @@ class CouponService:
         )
         
         # 등록 로그 정보
-        register_log = None
-        if coupon_data["register_log_id"]:
-            register_log = RegisterLogInfo(
-                registerLogId=coupon_data["register_log_id"],
-                registeredAt=coupon_data["registered_at"],
-            )
+        register_log_id = coupon_data["register_log_id"]
+        register_log = RegisterLogInfo.model_construct(
+            registerLogId=register_log_id,
+            registeredAt=coupon_data["registered_at"],
+        ) if register_log_id is not None else None
         
         # 사용 여부 및 사용 로그 정보
-        is_used = coupon_data["use_log_id"] is not None
-        use_log = None
-        if is_used:
-            use_log = UseLogInfo(
-                useLogId=coupon_data["use_log_id"],
-                usedAt=coupon_data["used_at"],
-            )
+        is_used = coupon_data["is_used"]
+        use_log = UseLogInfo.model_construct(
+            useLogId=coupon_data["use_log_id"],
+            usedAt=coupon_data["used_at"],
+        ) if is_used else None
         
         return CouponDetailResponse(
             id=coupon_data["coupon_id"],
@@ -195,11 +428,11 @@ class CouponService:
         )
         
         if coupon_data is None:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 이미 등록된 쿠폰인지 확인 (본인이든 다른 사람이든 등록된 쿠폰은 조회 불가)
         if coupon_data["register_id"] is not None:
-            raise ValueError("ERR-NOT-YOURS")
+            raise ValueError(_ERR_NOT_YOURS)
         
         # 쿠폰 정보 반환 (등록하지 않고 조회만)
         return CouponAddResponse(
@@ -235,16 +468,16 @@ class CouponService:
         )
         
         if coupon_data is None:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 등록코드 검증
         if coupon_data["registration_code"] != registration_code:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 이미 다른 사람이 등록한 쿠폰인지 확인
         if coupon_data["register_id"] is not None:
             if coupon_data["register_id"] != member_id:
-                raise ValueError("ERR-NOT-YOURS")
+                raise ValueError(_ERR_NOT_YOURS)
         
         # 쿠폰 등록
         await self.coupon_repository.register_coupon(
@@ -259,52 +492,52 @@ class CouponService:
         member_id: int,
         page: int,
         size: int,
-    ) -> Page[PaymentLogItem]:
+        cursor: str | None = None,
+    ) -> tuple[KeysetPage[PaymentLogItem], str | None]:
         """
         회원의 결제된 쿠폰 사용 기록을 조회합니다.
         
         Args:
             member_id: 회원 ID
-            page: 페이지 번호 (1부터 시작)
+            page: 페이지 번호 (1부터 시작, 커서가 없을 때 사용하는 호환용 OFFSET 방식)
             size: 페이지 크기
+            cursor: 이전 응답의 다음 페이지 커서 토큰
             
         Returns:
-            페이징된 사용 로그 목록
+            (페이징된 사용 로그 목록, 다음 페이지 커서 토큰) 튜플 (마지막 페이지이면 커서는 None)
+            - 커서로 조회한 페이지는 total, page, pages가 None
+        
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우 ("ERR-IVD-VALUE")
         """
-        logs_data, total = await self.coupon_repository.find_payment_logs_by_member_id(
+        logs_data, total, next_keyset = await self.coupon_repository.find_payment_logs_by_member_id(
             member_id=member_id,
             page=page,
             size=size,
+            cursor=_decode_cursor(cursor) if cursor is not None else None,
         )
         
-        # PaymentLogItem 리스트 생성
-        items = []
-        for log_data in logs_data:
-            coupon_info = PaymentLogCouponInfo(
-                couponId=log_data["coupon_id"],
-                productName=log_data["product_name"],
-                partnerName=log_data["partner_name"],
-                isUsed=True,  # 사용 로그가 있으므로 항상 True
-                createdAt=log_data["created_at"],
-                expiredAt=log_data["expired_at"],
-            )
-            
-            items.append(
-                PaymentLogItem(
-                    useLogId=log_data["use_log_id"],
-                    coupon=coupon_info,
-                    usedAt=log_data["used_at"],
-                )
+        # PaymentLogItem 리스트 생성 (행마다 전역 조회를 하지 않도록 생성자를 지역 변수로 바인딩)
+        build_item = _build_payment_log_item
+        build_coupon_info = _build_payment_log_coupon_info
+        items = [
+            build_item(
+                useLogId=log_data["use_log_id"],
+                coupon=build_coupon_info(
+                    couponId=log_data["coupon_id"],
+                    productName=log_data["product_name"],
+                    partnerName=log_data["partner_name"],
+                    isUsed=True,  # 사용 로그가 있으므로 항상 True
+                    createdAt=log_data["created_at"],
+                    expiredAt=log_data["expired_at"],
+                ),
+                usedAt=log_data["used_at"],
             )
+            for log_data in logs_data
+        ]
         
-        # fastapi-pagination의 Page 객체 생성
-        return Page(
-            items=items,
-            total=total,
-            page=page,
-            size=size,
-            pages=(total + size - 1) // size if size > 0 else 0,
-        )
+        next_cursor = _encode_cursor(next_keyset) if next_keyset is not None else None
+        return _build_keyset_page(items, total, page, size, cursor), next_cursor
     
     async def delete_coupons(
         self,
@@ -324,52 +557,48 @@ class CouponService:
         Raises:
             ValueError: 쿠폰이 유효하지 않거나 본인이 등록하지 않은 경우
         """
-        # 쿠폰 소유권 검증
-        valid_ids, invalid_ids = await self.coupon_repository.validate_coupon_ownership(
+        # 쿠폰 소유권 검증과 삭제 처리를 한 번에 수행 (사용하지 않은 쿠폰 정보 반환)
+        unused_coupons_data, invalid_count = await self.coupon_repository.mark_coupons_as_deleted(
             coupon_ids=coupon_ids,
             member_id=member_id,
         )
         
-        if invalid_ids:
-            # 유효하지 않은 쿠폰이 있는 경우
-            # 먼저 존재하지 않는 쿠폰인지 확인
-            if len(invalid_ids) == len(coupon_ids):
+        if invalid_count:
+            # 유효하지 않은 쿠폰이 있는 경우 (삭제는 수행되지 않음)
+            if invalid_count == len(set(coupon_ids)):
                 # 모든 쿠폰이 유효하지 않은 경우
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
             else:
                 # 일부 쿠폰이 본인이 등록하지 않은 경우
-                raise ValueError("ERR-NOT-YOURS")
+                raise ValueError(_ERR_NOT_YOURS)
         
-        # 쿠폰 삭제 처리 및 사용하지 않은 쿠폰 정보 반환
-        unused_coupons_data = await self.coupon_repository.mark_coupons_as_deleted(
-            coupon_ids=valid_ids,
-            member_id=member_id,
-        )
-        
-        # 사용하지 않은 쿠폰의 상세 정보를 응답 형식으로 변환
+        # 사용하지 않은 쿠폰의 상세 정보를 응답 형식으로 변환 (생성자를 지역 변수로 바인딩)
+        partner_info = PartnerInfo
+        register_info = RegisterInfo
+        build_register_log = RegisterLogInfo.model_construct
+        coupon_detail = CouponDetailResponse
         unused_coupons = []
         for coupon_data in unused_coupons_data:
-            partner = PartnerInfo(
+            partner = partner_info(
                 partnerId=coupon_data["partner_id"],
                 partnerName=coupon_data["partner_name"],
                 phones=coupon_data["partner_phones"],
             )
             
-            register = RegisterInfo(
+            register = register_info(
                 memberId=coupon_data["member_id"],
                 memberName=coupon_data["member_name"],
                 memberBirth=coupon_data["member_birth"],
             )
             
-            register_log = None
-            if coupon_data["register_log_id"]:
-                register_log = RegisterLogInfo(
-                    registerLogId=coupon_data["register_log_id"],
-                    registeredAt=coupon_data["registered_at"],
-                )
+            register_log_id = coupon_data["register_log_id"]
+            register_log = build_register_log(
+                registerLogId=register_log_id,
+                registeredAt=coupon_data["registered_at"],
+            ) if register_log_id is not None else None
             
             unused_coupons.append(
-                CouponDetailResponse(
+                coupon_detail(
                     id=coupon_data["coupon_id"],
                     productName=coupon_data["product_name"],
                     partner=partner,
@@ -462,7 +691,7 @@ class CouponService:
         
         if invalid_ids:
             # 권한이 없는 이슈가 있는 경우
-            raise ValueError("ERR-NOT-YOURS")
+            raise ValueError(_ERR_NOT_YOURS)
     
     async def get_partners_by_keyword(
         self,
@@ -574,18 +803,18 @@ class CouponService:
         # 유효성 검사
         # 1. products가 비어있는 경우
         if not products or len(products) == 0:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 2. partner 유효성 검사
         partner_is_new = partner.get("isNew", False)
         if not partner_is_new:
             # 기존 파트너인 경우 partnerId 필수
             if partner.get("partnerId") is None:
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
         else:
             # 신규 파트너인 경우 partnerName, partnerPhone 필수
             if not partner.get("partnerName") or not partner.get("partnerPhone"):
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
         
         # 3. products 유효성 검사
         products_data = []
@@ -594,16 +823,16 @@ class CouponService:
             count = product.get("count", 0)
             
             if count <= 0:
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
             
             if not is_new:
                 # 기존 상품인 경우 productId 필수
                 if product.get("productId") is None:
-                    raise ValueError("ERR-IVD-VALUE")
+                    raise ValueError(_ERR_IVD_VALUE)
             else:
                 # 신규 상품인 경우 productName 필수
                 if not product.get("productName"):
-                    raise ValueError("ERR-IVD-VALUE")
+                    raise ValueError(_ERR_IVD_VALUE)
             
             products_data.append({
                 "is_new": is_new,
@@ -655,7 +884,7 @@ class CouponService:
         print(issue_data)
         
         if not issue_data:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 날짜 포맷팅 (YYYY.MM.DD HH:MM:SS)
         requested_at = ensure_kst(issue_data["requested_at"])
@@ -718,11 +947,11 @@ class CouponService:
         )
         
         if not issue_data:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 아직 결정되지 않은 경우
         if issue_data.get("status") == "PENDING":
-            raise ValueError("ERR-NOT-DECIDED")
+            raise ValueError(_ERR_NOT_DECIDED)
         
         # 승인된 경우
         if issue_data.get("status") == "APPROVED":
@@ -789,7 +1018,7 @@ class CouponService:
             )
         
         # 알 수 없는 상태
-        raise ValueError("ERR-IVD-VALUE")
+        raise ValueError(_ERR_IVD_VALUE)
     
     async def decide_issue(
         self,
@@ -816,7 +1045,7 @@ class CouponService:
         # 유효성 검사
         if is_approved:
             if not products or len(products) == 0:
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
             
             # products 유효성 검사
             products_data = []
@@ -825,16 +1054,16 @@ class CouponService:
                 count = product.get("count", 0)
                 
                 if count <= 0:
-                    raise ValueError("ERR-IVD-VALUE")
+                    raise ValueError(_ERR_IVD_VALUE)
                 
                 if not is_new:
                     # 기존 상품인 경우 productId 필수
                     if product.get("productId") is None:
-                        raise ValueError("ERR-IVD-VALUE")
+                        raise ValueError(_ERR_IVD_VALUE)
                 else:
                     # 신규 상품인 경우 productName 필수
                     if not product.get("productName"):
-                        raise ValueError("ERR-IVD-VALUE")
+                        raise ValueError(_ERR_IVD_VALUE)
                 
                 products_data.append({
                     "is_new": is_new,
@@ -844,7 +1073,7 @@ class CouponService:
                 })
         else:
             if not reason:
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
         
         # Repository 호출
         await self.coupon_repository.decide_issue(
@@ -875,7 +1104,7 @@ class CouponService:
         # 유효성 검사
         # 1. products가 비어있는 경우
         if not products or len(products) == 0:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 2. products 유효성 검사
         products_data = []
@@ -884,16 +1113,16 @@ class CouponService:
             count = product.get("count", 0)
             
             if count <= 0:
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
             
             if not is_new:
                 # 기존 상품인 경우 productId 필수
                 if product.get("productId") is None:
-                    raise ValueError("ERR-IVD-VALUE")
+                    raise ValueError(_ERR_IVD_VALUE)
             else:
                 # 신규 상품인 경우 productName 필수
                 if not product.get("productName"):
-                    raise ValueError("ERR-IVD-VALUE")
+                    raise ValueError(_ERR_IVD_VALUE)
             
             products_data.append({
                 "is_new": is_new,
@@ -934,11 +1163,11 @@ class CouponService:
         )
         
         if coupon_data is None:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 이미 사용한 경우 확인
         if coupon_data["use_log_id"] is not None:
-            raise ValueError("ERR-ALREADY-USED")
+            raise ValueError(_ERR_ALREADY_USED)
         
         # 쿠폰 정보 반환
         return PaymentTransactionResponse(
@@ -1004,15 +1233,15 @@ class CouponService:
             # 먼저 쿠폰이 존재하는지 확인
             coupon_exists = await self.coupon_repository.find_coupon_by_id(coupon_id)
             if coupon_exists is None:
-                raise ValueError("ERR-IVD-VALUE")
+                raise ValueError(_ERR_IVD_VALUE)
             else:
                 # 쿠폰은 존재하지만 소유하지 않은 경우
-                raise ValueError("ERR-NOT-YOURS")
+                raise ValueError(_ERR_NOT_YOURS)
         
         # 2. 쿠폰 유효성 검사
         # - 이미 사용한 경우
         if coupon_data["use_log_id"] is not None:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # - 만료된 경우
         now = now_kst()
@@ -1023,7 +1252,7 @@ class CouponService:
         # timezone-naive를 timezone-aware로 변환 (KST로 가정)
         expired_at = expired_at.replace(tzinfo=KST_TIMEZONE)
         if expired_at < now:
-            raise ValueError("ERR-IVD-VALUE")
+            raise ValueError(_ERR_IVD_VALUE)
         
         # 3. 기존 활성 QR 코드 만료 처리
         await self.coupon_repository.expire_payment_qr_by_coupon_id(coupon_id)
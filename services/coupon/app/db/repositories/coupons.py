@@ -2,292 +2,891 @@
 쿠폰 관련 Repository 구현
 """
 import asyncio
-from datetime import datetime
-from typing import Callable, Protocol, Tuple
+import random
+from concurrent.futures import Executor
+from datetime import date, datetime, timedelta
+from typing import Callable
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, bindparam, text
 
-from services.coupon.app.db.session import session_scope
+from libs.common import now_kst
+from services.coupon.app.core.CouponService import CouponRepositoryPort
+from services.coupon.app.db.session import db_executor, read_session_scope, session_scope
 
 
-class CouponRepositoryPort(Protocol):
-    """쿠폰 Repository 인터페이스"""
-    
-    async def find_coupons_by_member_id(
-        self,
-        member_id: int,
-        page: int,
-        size: int,
-    ) -> Tuple[list[dict], int]:
-        """
-        회원 ID로 쿠폰 목록을 조회합니다 (페이징 지원).
-        
-        Args:
-            member_id: 회원 ID
-            page: 페이지 번호 (1부터 시작)
-            size: 페이지 크기
-            
-        Returns:
-            (쿠폰 목록, 전체 개수) 튜플
-        """
-        ...
-    
-    async def find_coupon_by_id(
-        self,
-        coupon_id: int,
-    ) -> dict | None:
-        """
-        쿠폰 ID로 쿠폰 상세 정보를 조회합니다.
-        
-        Args:
-            coupon_id: 쿠폰 ID
-            
-        Returns:
-            쿠폰 상세 정보 딕셔너리 또는 None
-        """
-        ...
-    
-    async def validate_coupon_ownership(
-        self,
-        coupon_ids: list[int],
-        member_id: int,
-    ) -> tuple[list[int], list[int]]:
-        """
-        쿠폰 소유권을 검증합니다.
-        
-        Args:
-            coupon_ids: 검증할 쿠폰 ID 목록
-            member_id: 회원 ID
-            
-        Returns:
-            (유효한 쿠폰 ID 목록, 유효하지 않은 쿠폰 ID 목록) 튜플
-        """
-        ...
-    
-    async def mark_coupons_as_deleted(
-        self,
-        coupon_ids: list[int],
-        member_id: int,
-    ) -> list[dict]:
-        """
-        쿠폰들을 삭제 처리합니다 (register_logs에 deleted_at 기록).
-        삭제된 쿠폰 중 사용하지 않은 쿠폰의 상세 정보를 반환합니다.
-        
-        Args:
-            coupon_ids: 삭제할 쿠폰 ID 목록
-            member_id: 회원 ID
-            
-        Returns:
-            삭제된 쿠폰 중 사용하지 않은 쿠폰의 상세 정보 목록
-        """
-        ...
-    
-    async def find_payment_logs_by_member_id(
-        self,
-        member_id: int,
-        page: int,
-        size: int,
-    ) -> Tuple[list[dict], int]:
-        """
-        회원 ID로 결제된 쿠폰의 사용 기록을 조회합니다 (페이징 지원).
-        
-        Args:
-            member_id: 회원 ID
-            page: 페이지 번호 (1부터 시작)
-            size: 페이지 크기
-            
-        Returns:
-            (사용 로그 목록, 전체 개수) 튜플
-        """
-        ...
-    
-    async def find_coupon_by_registration_code(
-        self,
-        registration_code: str,
-    ) -> dict | None:
-        """
-        등록코드로 쿠폰을 조회합니다.
-        
-        Args:
-            registration_code: 쿠폰 등록 코드
-            
-        Returns:
-            쿠폰 정보 딕셔너리 또는 None
-        """
-        ...
-    
-    async def register_coupon(
-        self,
-        coupon_id: int,
-        member_id: int,
-        registration_code: str,
-        signature_code: str,
-    ) -> None:
-        """
-        쿠폰을 회원에게 등록합니다.
-        
-        Args:
-            coupon_id: 쿠폰 ID
-            member_id: 회원 ID
-            registration_code: 등록 코드 (검증용)
-            signature_code: 서명 이미지 코드
-        """
-        ...
-    
-    async def find_coupon_by_id_for_payment_qr(
-        self,
-        coupon_id: int,
-        member_id: int,
-    ) -> dict | None:
-        """
-        결제 QR 생성을 위한 쿠폰 정보를 조회합니다 (소유권 확인 포함).
-        
-        Args:
-            coupon_id: 쿠폰 ID
-            member_id: 회원 ID (소유권 확인용)
-            
-        Returns:
-            쿠폰 정보 딕셔너리 또는 None
-            - coupon_id: 쿠폰 ID
-            - registration_code: 결제코드
-            - register_id: 등록자 ID
-            - use_log_id: 사용 로그 ID
-            - expired_at: 쿠폰 만료 일시
-        """
-        ...
+# 파트너 전화번호 목록을 한 컬럼으로 집계하는 상관 서브쿼리 (phone_id 순서 유지)
+# 구분자는 전화번호에 나올 수 없는 제어 문자(0x1F, Unit Separator)를 사용 (SEPARATOR에는 문자열 리터럴만 허용되어 X'1F'로 지정)
+_PARTNER_PHONES_SEPARATOR = "\x1f"
+_PARTNER_PHONES_SQL = """
+    (SELECT GROUP_CONCAT(ph.number ORDER BY ph.phone_id SEPARATOR X'1F')
+     FROM phones ph
+     WHERE ph.contact_account_type = 'PARTNER'
+       AND ph.account_id = pu.partner_id) as partner_phones
+"""
+
+
+# 응답 일시 문자열 형식 (DB에서는 DATETIME/DATE 그대로 조회하고 Python에서 변환)
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_DATE_FORMAT = "%Y-%m-%d"
+
+
+def _format_datetime(value: datetime | None) -> str | None:
+    """DATETIME 값을 응답용 문자열로 변환합니다."""
+    return value.strftime(_DATETIME_FORMAT) if value is not None else None
+
+
+def _format_date(value: date | None) -> str | None:
+    """DATE 값을 응답용 문자열로 변환합니다."""
+    return value.strftime(_DATE_FORMAT) if value is not None else None
+
+
+def _parse_partner_phones(value: str | None) -> list[str]:
+    """GROUP_CONCAT 결과를 전화번호 목록으로 변환합니다 (전화번호가 없으면 NULL)."""
+    return value.split(_PARTNER_PHONES_SEPARATOR) if value else []
+
+
+# 자주 호출되는 쿠폰 조회/삭제 SQL (요청마다 text()를 새로 만들지 않도록 모듈 로드 시 한 번만 생성)
+# 쿠폰 목록 조회 (JOIN으로 상품명, 파트너명 포함, 삭제되지 않은 쿠폰만, 전체 개수는 윈도우 함수로 함께 계산)
+# OFFSET으로 건너뛰는 행은 coupons 인덱스만으로 처리하고, 해당 페이지 행만 상품/파트너와 JOIN (지연 JOIN)
+# 삭제 여부는 coupons.deleted_at(register_logs.deleted_at과 함께 갱신)으로 판단해 register_logs JOIN 없이 조회
+_FIND_COUPONS_SQL = text("""
+    SELECT 
+        c.coupon_id,
+        p.product_name,
+        pu.partner_name,
+        CASE WHEN c.use_log_id IS NOT NULL THEN 1 ELSE 0 END as is_used,
+        '' as signature,
+        c.created_at,
+        c.expired_at,
+        page.total
+    FROM (
+        SELECT 
+            c.coupon_id,
+            COUNT(*) OVER() as total
+        FROM coupons c
+        WHERE c.register_id = :member_id
+          AND c.deleted_at IS NULL
+        ORDER BY c.created_at DESC, c.coupon_id DESC
+        LIMIT :size OFFSET :offset
+    ) page
+    INNER JOIN coupons c ON c.coupon_id = page.coupon_id
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
+    ORDER BY c.created_at DESC, c.coupon_id DESC
+""")
+# 쿠폰 목록 keyset 페이지네이션 (이전 페이지 마지막 행 이후만 조회, OFFSET 스캔 없음)
+# 전체 개수는 첫 페이지에서 한 번만 계산해 커서에 담아 전달하므로 여기서는 집계하지 않음
+_FIND_COUPONS_AFTER_CURSOR_SQL = text("""
+    SELECT 
+        c.coupon_id,
+        p.product_name,
+        pu.partner_name,
+        CASE WHEN c.use_log_id IS NOT NULL THEN 1 ELSE 0 END as is_used,
+        '' as signature,
+        c.created_at,
+        c.expired_at
+    FROM coupons c
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
+    WHERE c.register_id = :member_id
+      AND c.deleted_at IS NULL
+      AND (c.created_at < :cursor_created_at
+           OR (c.created_at = :cursor_created_at AND c.coupon_id < :cursor_coupon_id))
+    ORDER BY c.created_at DESC, c.coupon_id DESC
+    LIMIT :size
+""")
+_COUNT_COUPONS_SQL = text("""
+    SELECT COUNT(*) as total
+    FROM coupons c
+    WHERE c.register_id = :member_id
+      AND c.deleted_at IS NULL
+""")
+# 쿠폰 기본 정보 및 관련 정보 조회 (삭제되지 않은 쿠폰만)
+_FIND_COUPON_DETAIL_SQL = text(f"""
+    SELECT 
+        c.coupon_id,
+        c.register_id,
+        c.use_log_id,
+        c.register_log_id,
+        p.product_name,
+        pu.partner_id,
+        pu.partner_name,
+        m.member_id,
+        m.member_name,
+        m.member_birth,
+        c.created_at,
+        c.expired_at,
+        rl.registered_at,
+        ul.used_at,
+        c.use_log_id IS NOT NULL as is_used,
+        {_PARTNER_PHONES_SQL}
+    FROM coupons c
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
+    LEFT JOIN members m ON c.register_id = m.member_id
+    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
+    LEFT JOIN use_logs ul ON c.use_log_id = ul.use_log_id
+    WHERE c.coupon_id = :coupon_id
+      AND c.deleted_at IS NULL
+    LIMIT 1
+""")
+# 삭제할 쿠폰들의 register_log_id 조회 (본인이 등록한 쿠폰만)
+_SELECT_COUPONS_FOR_DELETE_SQL = text(f"""
+    SELECT 
+        c.coupon_id,
+        c.register_log_id,
+        c.use_log_id,
+        p.product_name,
+        pu.partner_id,
+        pu.partner_name,
+        c.created_at,
+        c.expired_at,
+        rl.registered_at,
+        {_PARTNER_PHONES_SQL}
+    FROM coupons c
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
+    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
+    WHERE c.coupon_id IN :coupon_ids
+      AND c.register_id = :member_id
+""").bindparams(bindparam("coupon_ids", expanding=True))
+# 삭제 요청 회원 정보 조회 (삭제 대상 쿠폰은 모두 같은 회원 소유이므로 행마다 JOIN하지 않고 한 번만 조회)
+_FIND_DELETE_MEMBER_SQL = text("""
+    SELECT 
+        m.member_id,
+        m.member_name,
+        m.member_birth
+    FROM members m
+    WHERE m.member_id = :member_id
+""")
+# register_logs와 coupons의 deleted_at을 한 문장으로 기록 (등록 로그가 없는 쿠폰은 coupons만 갱신)
+_MARK_COUPONS_DELETED_SQL = text("""
+    UPDATE coupons c
+    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
+    SET c.deleted_at = COALESCE(c.deleted_at, CURRENT_TIMESTAMP),
+        rl.deleted_at = COALESCE(rl.deleted_at, CURRENT_TIMESTAMP)
+    WHERE c.coupon_id IN :coupon_ids
+      AND c.register_id = :member_id
+""").bindparams(bindparam("coupon_ids", expanding=True))
+# 등록코드로 쿠폰 조회 (쿠폰 스캔/등록마다 호출)
+_FIND_COUPON_BY_REGISTRATION_CODE_SQL = text("""
+    SELECT 
+        c.coupon_id,
+        c.register_id,
+        p.product_name,
+        pu.partner_name,
+        c.created_at,
+        c.expired_at
+    FROM coupons c
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
+    WHERE c.registration_code = :registration_code
+    LIMIT 1
+""")
+# 쿠폰 등록 로그 생성
+_INSERT_REGISTER_LOG_SQL = text("""
+    INSERT INTO register_logs (register_user_id, registered_at, created_at, updated_at)
+    VALUES (:register_user_id, :registered_at, :created_at, :updated_at)
+""")
+# 쿠폰에 등록자/등록 로그/서명 반영 (재등록 시 삭제 표시 해제)
+_ASSIGN_COUPON_REGISTER_SQL = text("""
+    UPDATE coupons
+    SET register_id = :member_id,
+        register_log_id = :register_log_id,
+        signature_code = :signature_code,
+        deleted_at = NULL
+    WHERE coupon_id = :coupon_id
+""")
+# 사용 로그 목록 조회 (JOIN으로 쿠폰 정보 포함, 사용된 쿠폰만, 삭제되지 않은 쿠폰만, 전체 개수는 윈도우 함수로 함께 계산)
+# 쿠폰 목록과 마찬가지로 해당 페이지의 use_log_id만 먼저 구한 뒤 상품/파트너와 JOIN
+_FIND_PAYMENT_LOGS_SQL = text("""
+    SELECT 
+        ul.use_log_id,
+        c.coupon_id,
+        p.product_name,
+        pu.partner_name,
+        c.created_at,
+        c.expired_at,
+        ul.used_at,
+        page.total
+    FROM (
+        SELECT 
+            ul.use_log_id,
+            COUNT(*) OVER() as total
+        FROM use_logs ul
+        INNER JOIN coupons c ON ul.coupon_id = c.coupon_id
+        WHERE c.register_id = :member_id
+          AND c.deleted_at IS NULL
+        ORDER BY ul.used_at DESC, ul.use_log_id DESC
+        LIMIT :size OFFSET :offset
+    ) page
+    INNER JOIN use_logs ul ON ul.use_log_id = page.use_log_id
+    INNER JOIN coupons c ON ul.coupon_id = c.coupon_id
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
+    ORDER BY ul.used_at DESC, ul.use_log_id DESC
+""")
+_FIND_PAYMENT_LOGS_AFTER_CURSOR_SQL = text("""
+    SELECT 
+        ul.use_log_id,
+        c.coupon_id,
+        p.product_name,
+        pu.partner_name,
+        c.created_at,
+        c.expired_at,
+        ul.used_at
+    FROM use_logs ul
+    INNER JOIN coupons c ON ul.coupon_id = c.coupon_id
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
+    WHERE c.register_id = :member_id
+      AND c.deleted_at IS NULL
+      AND (ul.used_at < :cursor_used_at
+           OR (ul.used_at = :cursor_used_at AND ul.use_log_id < :cursor_use_log_id))
+    ORDER BY ul.used_at DESC, ul.use_log_id DESC
+    LIMIT :size
+""")
+_COUNT_PAYMENT_LOGS_SQL = text("""
+    SELECT COUNT(*) as total
+    FROM use_logs ul
+    INNER JOIN coupons c ON ul.coupon_id = c.coupon_id
+    WHERE c.register_id = :member_id
+      AND c.deleted_at IS NULL
+""")
+
+
+# 쿠폰 등록/결제 흐름 SQL (쿠폰 스캔/결제마다 호출)
+# 쿠폰 등록 전 등록코드/등록자 확인용 조회
+_FIND_COUPON_FOR_REGISTER_SQL = text("""
+    SELECT 
+        c.coupon_id,
+        c.registration_code,
+        c.register_id
+    FROM coupons c
+    WHERE c.coupon_id = :coupon_id
+    LIMIT 1
+""")
+# 결제코드로 결제 대상 쿠폰 조회 (유효기간 내 QR만)
+_FIND_COUPON_BY_PAYMENT_CODE_SQL = text("""
+    SELECT 
+        c.coupon_id,
+        p.product_name,
+        m.member_name as vendor_name,
+        c.created_at,
+        c.expired_at,
+        c.use_log_id
+    FROM payment_qr_codes pqr
+    INNER JOIN coupons c ON pqr.coupon_id = c.coupon_id
+    INNER JOIN products p ON c.product_id = p.product_id
+    INNER JOIN issue_logs il ON c.issue_id = il.issue_id
+    INNER JOIN members m ON il.vendor_id = m.member_id
+    WHERE pqr.payment_code = :payment_code
+      AND pqr.expired_at > :now
+    LIMIT 1
+""")
+# 결제 확정: 결제코드로 쿠폰 조회 (유효기간 확인 포함)
+_FIND_PAYMENT_TARGET_SQL = text("""
+    SELECT 
+        c.coupon_id,
+        c.issue_id,
+        c.use_log_id
+    FROM payment_qr_codes pqr
+    INNER JOIN coupons c ON pqr.coupon_id = c.coupon_id
+    WHERE pqr.payment_code = :payment_code
+      AND pqr.expired_at > :now
+    LIMIT 1
+""")
+# 결제 확정: use_logs 레코드 생성
+_INSERT_USE_LOG_SQL = text("""
+    INSERT INTO use_logs (coupon_id, used_at, created_at, updated_at)
+    VALUES (:coupon_id, :used_at, :created_at, :updated_at)
+""")
+# 결제 확정: coupons.use_log_id 갱신
+_MARK_COUPON_USED_SQL = text("""
+    UPDATE coupons
+    SET use_log_id = :use_log_id
+    WHERE coupon_id = :coupon_id
+""")
+# 결제 확정: 같은 발급 건의 전체/사용 쿠폰 개수
+_COUNT_ISSUE_COUPONS_USED_SQL = text("""
+    SELECT 
+        COUNT(*) as total_count,
+        SUM(CASE WHEN use_log_id IS NOT NULL THEN 1 ELSE 0 END) as used_count
+    FROM coupons
+    WHERE issue_id = :issue_id
+""")
+# 결제 확정: 모든 쿠폰이 사용된 발급 건을 COMPLETED로 변경
+_COMPLETE_ISSUE_SQL = text("""
+    UPDATE issue_logs
+    SET status = 'ISSUE_STATUS/COMPLETED'
+    WHERE issue_id = :issue_id
+      AND status IN ('ISSUE_STATUS/ISSUED', 'ISSUE_STATUS/SHARED')
+""")
+# 결제 QR 생성 대상 쿠폰 조회 (소유권 확인 포함)
+_FIND_COUPON_FOR_PAYMENT_QR_SQL = text("""
+    SELECT 
+        c.coupon_id,
+        c.registration_code,
+        c.register_id,
+        c.use_log_id,
+        c.expired_at
+    FROM coupons c
+    WHERE c.coupon_id = :coupon_id
+      AND c.register_id = :member_id
+      AND c.deleted_at IS NULL
+    LIMIT 1
+""")
+# 쿠폰의 활성 결제 QR 만료 처리
+_EXPIRE_PAYMENT_QRS_SQL = text("""
+    UPDATE payment_qr_codes
+    SET expired_at = :now
+    WHERE coupon_id = :coupon_id
+      AND expired_at > :now
+""")
+# 결제 QR 생성
+_INSERT_PAYMENT_QR_SQL = text("""
+    INSERT INTO payment_qr_codes (coupon_id, payment_code, expired_at, created_at, updated_at)
+    VALUES (:coupon_id, :payment_code, :expired_at, :created_at, :updated_at)
+""")
+# 쿠폰의 활성 결제 QR 조회
+_FIND_ACTIVE_PAYMENT_QR_SQL = text("""
+    SELECT 
+        payment_qr_id,
+        payment_code,
+        expired_at
+    FROM payment_qr_codes
+    WHERE coupon_id = :coupon_id
+      AND expired_at > :now
+    ORDER BY created_at DESC
+    LIMIT 1
+""")
+# 발행 요청: 기존 파트너 존재 확인
+_FIND_PARTNER_ID_SQL = text("""
+    SELECT partner_id FROM partner_users WHERE partner_id = :partner_id
+""")
+# 발행 요청: 선택한 기존 상품 중 해당 파트너 소유인 상품 ID 조회
+_FIND_PARTNER_PRODUCT_IDS_SQL = text("""
+    SELECT product_id FROM products
+    WHERE partner_id = :partner_id
+      AND product_id IN :product_ids
+""").bindparams(bindparam("product_ids", expanding=True))
+# 신규 상품 생성 (생성된 product_id가 필요하므로 건별 실행)
+_INSERT_PRODUCT_SQL = text("""
+    INSERT INTO products (partner_id, product_name, created_at)
+    VALUES (:partner_id, :product_name, :created_at)
+""")
+# 발행 요청 상품 생성
+# 파라미터 목록으로 실행하면 PyMySQL이 다중 VALUES 한 문장으로 묶어 전송 (VALUES 절에는 바인드 파라미터만 두어야 함)
+_INSERT_ISSUE_PRODUCTS_SQL = text("""
+    INSERT INTO issue_products (issue_id, product_id, product_name, stage, count, created_at)
+    VALUES (:issue_id, :product_id, :product_name, :stage, :count, :created_at)
+""")
+# 파트너 가입 시 전화번호가 일치하는 발행 요청에 partner_id 매핑
+_ASSIGN_PARTNER_TO_ISSUES_SQL = text("""
+    UPDATE issue_logs
+    SET partner_id = :partner_id
+    WHERE partner_phone = :partner_phone
+      AND partner_id IS NULL
+""")
+# 파트너 가입 시 상품이 매핑되지 않은 발행 요청 상품 조회
+_FIND_PENDING_ISSUE_PRODUCTS_SQL = text("""
+    SELECT ip.issue_product_id, ip.product_name
+    FROM issue_products ip
+    INNER JOIN issue_logs il ON ip.issue_id = il.issue_id
+    WHERE il.partner_id = :partner_id
+      AND ip.product_id IS NULL
+      AND ip.product_name IS NOT NULL
+    ORDER BY ip.issue_product_id
+""")
+# 발행 요청 상품에 생성된 상품 매핑
+_ASSIGN_ISSUE_PRODUCT_SQL = text("""
+    UPDATE issue_products
+    SET product_id = :product_id
+    WHERE issue_product_id = :issue_product_id
+""")
+# 발행 요청 생성
+_INSERT_ISSUE_REQUEST_SQL = text("""
+    INSERT INTO issue_logs (
+        title, product_kind_count, requested_issue_count, approved_issue_count,
+        requested_at, valid_days, status, vendor_id, partner_id, partner_phone, partner_name, created_at
+    )
+    VALUES (
+        :title, :product_kind_count, :requested_issue_count, 0,
+        :requested_at, :valid_days, 'ISSUE_STATUS/PENDING', :vendor_id, :partner_id, :partner_phone, :partner_name, :created_at
+    )
+""")
+# 파트너 직접 발행 생성 (상태는 바로 ISSUED)
+_INSERT_SELF_ISSUE_SQL = text("""
+    INSERT INTO issue_logs (
+        title, product_kind_count, requested_issue_count, approved_issue_count,
+        requested_at, decided_at, valid_days, status, vendor_id, partner_id, created_at
+    )
+    VALUES (
+        :title, :product_kind_count, :approved_issue_count, :approved_issue_count,
+        :now, :now, :valid_days, 'ISSUE_STATUS/ISSUED', NULL, :partner_id, :created_at
+    )
+""")
+# 상품 존재 및 파트너 소유 확인
+_FIND_PARTNER_PRODUCT_SQL = text("""
+    SELECT product_id FROM products 
+    WHERE product_id = :product_id AND partner_id = :partner_id
+""")
+# 발행 결정: 발행기록 조회 및 파트너 권한 확인
+_FIND_ISSUE_FOR_DECIDE_SQL = text("""
+    SELECT 
+        il.issue_id,
+        il.status,
+        il.partner_id,
+        il.vendor_id,
+        il.valid_days,
+        il.requested_issue_count
+    FROM issue_logs il
+    WHERE il.issue_id = :issue_id
+      AND il.partner_id = :partner_id
+      AND il.partner_deleted_at IS NULL
+""")
+# 발행 결정: 신규 상품의 REQUEST stage 원본 상품명 조회
+_FIND_REQUESTED_NEW_PRODUCT_NAME_SQL = text("""
+    SELECT product_name
+    FROM issue_products
+    WHERE issue_id = :issue_id
+      AND stage = 'REQUEST'
+      AND product_id IS NULL
+      AND product_name = :product_name
+    LIMIT 1
+""")
+# 발행 결정: 기존 상품의 REQUEST stage 원본 상품명 조회 (product_name이 NULL이면 products 테이블에서 가져옴)
+_FIND_REQUESTED_PRODUCT_NAME_SQL = text("""
+    SELECT 
+        COALESCE(ip.product_name, p.product_name) as product_name
+    FROM issue_products ip
+    LEFT JOIN products p ON ip.product_id = p.product_id
+    WHERE ip.issue_id = :issue_id
+      AND ip.stage = 'REQUEST'
+      AND ip.product_id = :product_id
+    LIMIT 1
+""")
+# 승인된 발행 상품 생성 (stage='APPROVE')
+_INSERT_APPROVED_ISSUE_PRODUCT_SQL = text("""
+    INSERT INTO issue_products (issue_id, product_id, product_name, stage, count, created_at)
+    VALUES (:issue_id, :product_id, :product_name, 'APPROVE', :count, :created_at)
+""")
+# 발급 쿠폰 registration_code 중복 확인
+_FIND_COUPON_ID_BY_REGISTRATION_CODE_SQL = text("""
+    SELECT coupon_id FROM coupons WHERE registration_code = :registration_code
+""")
+# 발급 쿠폰 생성
+_INSERT_ISSUED_COUPON_SQL = text("""
+    INSERT INTO coupons (
+        issue_id, product_id, registration_code, partner_id,
+        created_at, expired_at
+    )
+    VALUES (
+        :issue_id, :product_id, :registration_code, :partner_id,
+        :created_at, :expired_at
+    )
+""")
+# 발행 승인: 발행기록 상태/승인 수량 갱신
+_MARK_ISSUE_ISSUED_SQL = text("""
+    UPDATE issue_logs
+    SET status = 'ISSUE_STATUS/ISSUED',
+        decided_at = :decided_at,
+        approved_issue_count = :approved_issue_count,
+        product_kind_count = :product_kind_count
+    WHERE issue_id = :issue_id
+""")
+# 발행 거절: 발행기록 상태/사유 갱신
+_MARK_ISSUE_REJECTED_SQL = text("""
+    UPDATE issue_logs
+    SET status = 'ISSUE_STATUS/REJECTED',
+        decided_at = :decided_at,
+        reason = :reason
+    WHERE issue_id = :issue_id
+""")
+# 발행기록의 승인된 상품 목록 조회 (stage='APPROVE')
+_FIND_ISSUE_APPROVED_PRODUCTS_SQL = text("""
+    SELECT 
+        ip.product_id,
+        COALESCE(ip.product_name, p.product_name) as product_name,
+        ip.count
+    FROM issue_products ip
+    LEFT JOIN products p ON ip.product_id = p.product_id
+    WHERE ip.issue_id = :issue_id
+      AND ip.stage = 'APPROVE'
+    ORDER BY ip.issue_product_id
+""")
+
+
+# 발행기록 목록 조회 권한 조건 (사용자 타입별 소유자 일치 + 해당 측 soft delete 필터링)
+_ISSUE_SUBJECT_CONDITIONS = {
+    # 개인사용자: vendor_id가 member_id와 일치하고 벤더가 삭제하지 않은 이슈
+    "member": ("il.vendor_id = :subject_id", "il.vendor_deleted_at IS NULL"),
+    # 파트너사용자: partner_id가 일치하고 파트너가 삭제하지 않은 이슈
+    "partner": ("il.partner_id = :subject_id", "il.partner_deleted_at IS NULL"),
+}
+
+
+def _build_issue_delete_lookup_sql(subject_type: str) -> TextClause:
+    """발행기록 삭제 대상 중 해당 측에서 삭제되지 않은 이슈와 권한 여부를 조회하는 SQL을 생성합니다."""
+    owner_condition, not_deleted_condition = _ISSUE_SUBJECT_CONDITIONS[subject_type]
+    return text(f"""
+    SELECT 
+        il.issue_id,
+        {owner_condition} as has_permission
+    FROM issue_logs il
+    WHERE il.issue_id IN :issue_ids
+      AND {not_deleted_condition}
+""").bindparams(bindparam("issue_ids", expanding=True))
+
+
+# 사용자 타입 -> 발행기록 삭제 대상 조회 SQL
+_ISSUE_DELETE_LOOKUP_SQL_BY_SUBJECT = {
+    subject_type: _build_issue_delete_lookup_sql(subject_type)
+    for subject_type in _ISSUE_SUBJECT_CONDITIONS
+}
+# 아래 삭제 SQL은 권한/상태 조건을 WHERE 절에 포함하여, 조회 이후 상태가 바뀐 이슈를 잘못 처리하지 않도록 함
+# 발행기록 완전 삭제 (벤더요청, 파트너 승인 이전)
+_DELETE_PENDING_ISSUES_FOR_VENDOR_SQL = text("""
+    DELETE FROM issue_logs
+    WHERE issue_id IN :issue_ids
+      AND vendor_id = :subject_id
+      AND vendor_deleted_at IS NULL
+      AND status IN ('ISSUE_STATUS/PENDING', 'ISSUE_STATUS/PAYMENT_READY')
+""").bindparams(bindparam("issue_ids", expanding=True))
+# 발행기록 벤더측 삭제 표시 (벤더요청, 파트너 승인 이후)
+_SOFT_DELETE_APPROVED_ISSUES_FOR_VENDOR_SQL = text("""
+    UPDATE issue_logs
+    SET vendor_deleted_at = :deleted_at
+    WHERE issue_id IN :issue_ids
+      AND vendor_id = :subject_id
+      AND vendor_deleted_at IS NULL
+      AND status IN ('ISSUE_STATUS/ISSUED', 'ISSUE_STATUS/SHARED', 'ISSUE_STATUS/COMPLETED')
+""").bindparams(bindparam("issue_ids", expanding=True))
+# 발행기록 파트너측 삭제 표시 (파트너요청)
+# 승인 이전 이슈는 벤더측에서 거절로 보이도록 status/decided_at도 함께 변경
+# (MySQL은 SET 절을 왼쪽부터 적용하므로 변경 전 status를 보도록 decided_at을 status보다 먼저 둠)
+_SOFT_DELETE_ISSUES_FOR_PARTNER_SQL = text("""
+    UPDATE issue_logs
+    SET decided_at = CASE
+            WHEN status IN ('ISSUE_STATUS/PENDING', 'ISSUE_STATUS/PAYMENT_READY') THEN :deleted_at
+            ELSE decided_at
+        END,
+        status = CASE
+            WHEN status IN ('ISSUE_STATUS/PENDING', 'ISSUE_STATUS/PAYMENT_READY') THEN 'ISSUE_STATUS/REJECTED'
+            ELSE status
+        END,
+        partner_deleted_at = :deleted_at
+    WHERE issue_id IN :issue_ids
+      AND partner_id = :subject_id
+      AND partner_deleted_at IS NULL
+      AND status IN (
+          'ISSUE_STATUS/PENDING', 'ISSUE_STATUS/PAYMENT_READY',
+          'ISSUE_STATUS/ISSUED', 'ISSUE_STATUS/SHARED', 'ISSUE_STATUS/COMPLETED'
+      )
+""").bindparams(bindparam("issue_ids", expanding=True))
+
+
+def _build_issue_list_sql(subject_type: str, has_status: bool, has_title: bool) -> tuple:
+    """발행기록 목록의 (개수 조회, 목록 조회) SQL을 필터 조합에 맞게 생성합니다."""
+    where_conditions = list(_ISSUE_SUBJECT_CONDITIONS[subject_type])
+    if has_status:
+        where_conditions.append("il.status = :status")
+    if has_title:
+        where_conditions.append("il.title LIKE :title")
+    where_clause = " AND ".join(where_conditions)
     
-    async def expire_payment_qr_by_coupon_id(
-        self,
-        coupon_id: int,
-    ) -> None:
-        """
-        특정 쿠폰의 모든 활성 QR 코드를 만료 처리합니다.
-        
-        Args:
-            coupon_id: 쿠폰 ID
-        """
-        ...
+    count_query = text(f"""
+    SELECT COUNT(*)
+    FROM issue_logs il
+    WHERE {where_clause}
+""")
+    query = text(f"""
+    SELECT 
+        il.issue_id,
+        il.title,
+        il.product_kind_count,
+        il.status
+    FROM issue_logs il
+    WHERE {where_clause}
+    ORDER BY il.requested_at DESC
+    LIMIT :size OFFSET :offset
+""")
+    return (count_query, query)
+
+
+# (사용자 타입, status 필터 여부, title 필터 여부) -> (개수 조회, 목록 조회) SQL (모듈 로드 시 모든 조합 생성)
+_ISSUE_LIST_SQL_BY_FILTER = {
+    (subject_type, has_status, has_title): _build_issue_list_sql(subject_type, has_status, has_title)
+    for subject_type in _ISSUE_SUBJECT_CONDITIONS
+    for has_status in (False, True)
+    for has_title in (False, True)
+}
+
+
+def _build_partner_search_sql(has_keyword: bool) -> tuple:
+    """파트너 검색의 (개수 조회, 목록 조회) SQL을 keyword 필터 여부에 맞게 생성합니다."""
+    where_conditions = ["p.contact_account_type = 'PARTNER'"]
+    if has_keyword:
+        # keyword 필터 (파트너 상호명 LIKE 검색)
+        where_conditions.append("pu.partner_name LIKE :keyword")
+    where_clause = " AND ".join(where_conditions)
     
-    async def create_payment_qr(
-        self,
-        coupon_id: int,
-        payment_code: str,
-        expired_at: datetime,
-    ) -> int:
-        """
-        결제 QR 코드를 생성합니다.
-        
-        Args:
-            coupon_id: 쿠폰 ID
-            payment_code: 결제코드 (registration_code)
-            expired_at: 만료 일시
-            
-        Returns:
-            생성된 결제 QR 코드 ID
-        """
-        ...
+    count_query = text(f"""
+    SELECT COUNT(DISTINCT pu.partner_id)
+    FROM partner_users pu
+    INNER JOIN phones p ON p.account_id = pu.partner_id
+    WHERE {where_clause}
+""")
+    # 응답에는 번호 순으로 첫 번째 전화번호만 사용하므로 GROUP_CONCAT 대신 MIN으로 바로 구함
+    query = text(f"""
+    SELECT 
+        pu.partner_id,
+        pu.partner_name,
+        MIN(p.number) as number,
+        COUNT(*) OVER() as total
+    FROM partner_users pu
+    INNER JOIN phones p ON p.account_id = pu.partner_id
+    WHERE {where_clause}
+    GROUP BY pu.partner_id, pu.partner_name
+    ORDER BY pu.partner_name ASC
+    LIMIT :size OFFSET :offset
+""")
+    return (count_query, query)
+
+
+def _build_product_search_sql(has_keyword: bool) -> tuple:
+    """파트너 상품 검색의 (개수 조회, 목록 조회) SQL을 keyword 필터 여부에 맞게 생성합니다."""
+    where_conditions = ["p.partner_id = :partner_id"]
+    if has_keyword:
+        # keyword 필터 (상품명 LIKE 검색)
+        where_conditions.append("p.product_name LIKE :keyword")
+    where_clause = " AND ".join(where_conditions)
     
-    async def find_active_payment_qr_by_coupon_id(
-        self,
-        coupon_id: int,
-    ) -> dict | None:
-        """
-        활성 결제 QR 코드를 조회합니다.
-        
-        Args:
-            coupon_id: 쿠폰 ID
-            
-        Returns:
-            결제 QR 코드 정보 딕셔너리 또는 None
-            - payment_qr_id: 결제 QR 코드 ID
-            - payment_code: 결제코드
-            - expired_at: 만료 일시
-        """
-        ...
+    count_query = text(f"""
+    SELECT COUNT(*)
+    FROM products p
+    WHERE {where_clause}
+""")
+    query = text(f"""
+    SELECT 
+        p.product_id,
+        p.product_name,
+        COUNT(*) OVER() as total
+    FROM products p
+    WHERE {where_clause}
+    ORDER BY p.product_name ASC
+    LIMIT :size OFFSET :offset
+""")
+    return (count_query, query)
+
+
+# keyword 필터 여부 -> (개수 조회, 목록 조회) SQL (모듈 로드 시 모든 조합 생성)
+# 목록 조회가 전체 개수를 윈도우 함수로 함께 계산하므로 개수 조회는 범위를 벗어난 페이지에서만 사용
+_PARTNER_SEARCH_SQL_BY_FILTER = {
+    has_keyword: _build_partner_search_sql(has_keyword)
+    for has_keyword in (False, True)
+}
+_PRODUCT_SEARCH_SQL_BY_FILTER = {
+    has_keyword: _build_product_search_sql(has_keyword)
+    for has_keyword in (False, True)
+}
+
+
+# 발행기록 벤더(회원) 정보 컬럼 (members LEFT JOIN 필요, 전화번호는 상관 서브쿼리로 1건만 가져와 행이 중복되지 않도록 함)
+_ISSUE_VENDOR_COLUMNS_SQL = """
+        m.member_id as vendor_member_id,
+        m.member_name as vendor_member_name,
+        (SELECT vp.number 
+         FROM phones vp 
+         WHERE vp.contact_account_type = 'MEMBER' 
+           AND vp.account_id = m.member_id 
+         LIMIT 1) as vendor_phone"""
+# 발행기록 파트너 정보 컬럼 (partner_users LEFT JOIN 필요)
+# 가입한 파트너는 파트너 계정 정보를, 아직 가입하지 않은 파트너는 발행 요청 시 입력한 partner_name/partner_phone을 사용
+# (둘 다 없으면 모두 NULL)
+_ISSUE_PARTNER_COLUMNS_SQL = """
+        pu.partner_id as partner_user_id,
+        CASE
+            WHEN pu.partner_id IS NOT NULL THEN pu.partner_name
+            WHEN il.partner_phone <> '' THEN NULLIF(il.partner_name, '')
+        END as partner_display_name,
+        CASE
+            WHEN pu.partner_id IS NOT NULL THEN NULLIF((SELECT pp.number 
+                 FROM phones pp 
+                 WHERE pp.contact_account_type = 'PARTNER' 
+                   AND pp.account_id = pu.partner_id 
+                 ORDER BY pp.phone_id
+                 LIMIT 1), '')
+            WHEN il.partner_phone <> '' THEN il.partner_phone
+        END as partner_display_number"""
+# 발행기록 벤더/파트너 JOIN
+_ISSUE_PARTIES_JOIN_SQL = """
+    LEFT JOIN members m ON m.member_id = il.vendor_id
+    LEFT JOIN partner_users pu ON pu.partner_id = il.partner_id"""
+
+
+def _build_issue_request_sql(subject_type: str) -> TextClause:
+    """발행요청서 조회 SQL을 사용자 타입별 권한 조건에 맞게 생성합니다."""
+    permission_condition = " AND ".join(_ISSUE_SUBJECT_CONDITIONS[subject_type])
+    return text(f"""
+    SELECT 
+        il.issue_id,
+        il.title,
+        il.status,
+        il.requested_at,{_ISSUE_VENDOR_COLUMNS_SQL},{_ISSUE_PARTNER_COLUMNS_SQL}
+    FROM issue_logs il{_ISSUE_PARTIES_JOIN_SQL}
+    WHERE il.issue_id = :issue_id
+      AND {permission_condition}
+""")
+
+
+# 사용자 타입 -> 발행요청서 조회 SQL
+_ISSUE_REQUEST_SQL_BY_SUBJECT = {
+    subject_type: _build_issue_request_sql(subject_type)
+    for subject_type in _ISSUE_SUBJECT_CONDITIONS
+}
+# 발행요청서의 요청 상품 목록 조회
+_FIND_ISSUE_REQUEST_PRODUCTS_SQL = text("""
+    SELECT 
+        ip.product_id,
+        COALESCE(ip.product_name, p.product_name) as product_name,
+        ip.count
+    FROM issue_products ip
+    LEFT JOIN products p ON ip.product_id = p.product_id
+    WHERE ip.issue_id = :issue_id
+      AND ip.stage = 'REQUEST'
+    ORDER BY ip.issue_product_id
+""")
+
+
+def _build_issue_decision_sql(subject_type: str) -> TextClause:
+    """발행기록 결정 정보 조회 SQL(벤더/파트너 정보 포함)을 사용자 타입별 권한 조건에 맞게 생성합니다."""
+    permission_condition = " AND ".join(_ISSUE_SUBJECT_CONDITIONS[subject_type])
+    return text(f"""
+    SELECT 
+        il.issue_id,
+        il.status,
+        il.requested_issue_count,
+        il.approved_issue_count,
+        il.valid_days,
+        il.vendor_id,
+        il.requested_at,
+        il.decided_at,
+        il.reason,{_ISSUE_VENDOR_COLUMNS_SQL},{_ISSUE_PARTNER_COLUMNS_SQL}
+    FROM issue_logs il{_ISSUE_PARTIES_JOIN_SQL}
+    WHERE il.issue_id = :issue_id
+      AND {permission_condition}
+""")
+
+
+# 사용자 타입 -> 발행기록 결정 정보 조회 SQL
+_ISSUE_DECISION_SQL_BY_SUBJECT = {
+    subject_type: _build_issue_decision_sql(subject_type)
+    for subject_type in _ISSUE_SUBJECT_CONDITIONS
+}
 
 
 class _SQLRepositoryBase:
     """SQL Repository 기본 클래스"""
-    def __init__(self, session_factory: Callable = session_scope):
+    def __init__(
+        self,
+        session_factory: Callable = session_scope,
+        executor: Executor = db_executor,
+        read_session_factory: Callable = read_session_scope,
+    ):
         self._session_factory = session_factory
+        # 쓰기가 없는 목록/검색 조회는 READ COMMITTED 세션 사용 (쓰기 트랜잭션은 기본 격리 수준 유지)
+        self._read_session_factory = read_session_factory
+        self._executor = executor
 
     async def _run_in_thread(self, func: Callable):
-        """동기 함수를 비동기로 실행"""
-        return await asyncio.to_thread(func)
+        """동기 함수를 DB 전용 스레드 풀에서 비동기로 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
 
 
-class SQLAlchemyCouponRepository(_SQLRepositoryBase):
+class SQLAlchemyCouponRepository(_SQLRepositoryBase, CouponRepositoryPort):
     """SQLAlchemy를 사용한 쿠폰 Repository 구현"""
     
+    def __init__(
+        self,
+        session_factory: Callable = session_scope,
+        executor: Executor = db_executor,
+        read_session_factory: Callable = read_session_scope,
+    ):
+        super().__init__(session_factory, executor, read_session_factory)
+        # 조회 결과는 프로세스 로컬로 캐시하지 않음 (gunicorn 워커끼리 무효화가 공유되지 않아 다른 워커가 이전 결과를 반환함)
+        # 이벤트 루프 스레드에서만 접근하므로 별도 락 없이 사용
+        # 쿠폰 ID -> 진행 중인 상세 조회 작업 (같은 쿠폰 조회가 동시에 몰려도 DB 조회는 한 번만 수행)
+        self._coupon_detail_inflight: dict[int, asyncio.Future] = {}
+    
+    def _invalidate_coupon_detail(self, coupon_ids: list[int]) -> None:
+        """
+        쿠폰 변경 이후의 조회가 변경 전 결과를 받지 않도록 합니다.
+        
+        변경 전에 시작된 상세 조회 작업을 진행 중 목록에서 제거해 이후 요청은 새로 조회하도록 합니다.
+        """
+        for coupon_id in coupon_ids:
+            self._coupon_detail_inflight.pop(coupon_id, None)
+    
+    def _discard_coupon_detail_inflight(self, coupon_id: int, task: asyncio.Future) -> None:
+        """완료된 상세 조회 작업을 진행 중 목록에서 제거합니다 (무효화 이후 새로 시작된 작업은 유지)."""
+        if self._coupon_detail_inflight.get(coupon_id) is task:
+            del self._coupon_detail_inflight[coupon_id]
+    
     async def find_coupons_by_member_id(
         self,
         member_id: int,
         page: int,
         size: int,
-    ) -> Tuple[list[dict], int]:
+        cursor: tuple[datetime, int] | None = None,
+    ) -> tuple[list[dict], int | None, tuple[datetime, int] | None]:
         """
         회원 ID로 쿠폰 목록을 조회합니다 (페이징 지원).
         
         사용한 쿠폰도 포함하여 조회합니다.
         """
         def _query():
-            offset = (page - 1) * size
+            # 다음 페이지 존재 여부를 알 수 있도록 한 행을 더 조회
+            if cursor is None:
+                query = _FIND_COUPONS_SQL
+                params = {"member_id": member_id, "size": size + 1, "offset": (page - 1) * size}
+            else:
+                query = _FIND_COUPONS_AFTER_CURSOR_SQL
+                params = {"member_id": member_id, "size": size + 1, "cursor_created_at": cursor[0], "cursor_coupon_id": cursor[1]}
             
-            with self._session_factory() as session:
-                # 전체 개수 조회 (삭제되지 않은 쿠폰만)
-                count_query = text("""
-                    SELECT COUNT(*) as total
-                    FROM coupons c
-                    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
-                    WHERE c.register_id = :member_id
-                      AND (rl.deleted_at IS NULL OR rl.register_log_id IS NULL)
-                """)
-                count_result = session.execute(count_query, {"member_id": member_id}).fetchone()
-                total = count_result[0] if count_result else 0
-                
-                # 쿠폰 목록 조회 (JOIN으로 상품명, 파트너명 포함, 삭제되지 않은 쿠폰만)
-                query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        p.product_name,
-                        pu.partner_name,
-                        CASE WHEN c.use_log_id IS NOT NULL THEN 1 ELSE 0 END as is_used,
-                        '' as signature,
-                        DATE_FORMAT(c.created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                        DATE_FORMAT(c.expired_at, '%Y-%m-%d %H:%i:%s') as expired_at
-                    FROM coupons c
-                    INNER JOIN products p ON c.product_id = p.product_id
-                    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
-                    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
-                    WHERE c.register_id = :member_id
-                      AND (rl.deleted_at IS NULL OR rl.register_log_id IS NULL)
-                    ORDER BY c.created_at DESC
-                    LIMIT :size OFFSET :offset
-                """)
+            with self._read_session_factory() as session:
+                rows = session.execute(query, params).mappings().all()
+                has_next = len(rows) > size
+                rows = rows[:size]
+                # 다음 페이지 커서는 표시용 문자열이 아닌 원본 정렬 값으로 생성
+                next_keyset = (rows[-1]["created_at"], rows[-1]["coupon_id"]) if has_next and rows else None
+                
+                if cursor is not None:
+                    # 커서 조회는 전체 개수를 다시 집계하지 않음 (첫 페이지의 개수를 커서로 전달받아 사용)
+                    total = None
+                elif rows:
+                    total = rows[0]["total"]
+                elif page > 1:
+                    # 범위를 벗어난 페이지는 윈도우 함수 결과가 없으므로 전체 개수를 별도로 조회
+                    total = session.execute(_COUNT_COUPONS_SQL, {"member_id": member_id}).scalar() or 0
+                else:
+                    total = 0
                 
-                result = session.execute(
-                    query,
+                # 결과를 딕셔너리 리스트로 변환
+                coupons = [
                     {
-                        "member_id": member_id,
-                        "size": size,
-                        "offset": offset,
+                        "coupon_id": row["coupon_id"],
+                        "product_name": row["product_name"],
+                        "partner_name": row["partner_name"],
+                        "is_used": bool(row["is_used"]),
+                        "signature": row["signature"] or "",
+                        "created_at": _format_datetime(row["created_at"]),
+                        "expired_at": _format_datetime(row["expired_at"]),
                     }
-                ).fetchall()
-                
-                # 결과를 딕셔너리 리스트로 변환
-                coupons = []
-                for row in result:
-                    coupons.append({
-                        "coupon_id": row[0],
-                        "product_name": row[1],
-                        "partner_name": row[2],
-                        "is_used": bool(row[3]),
-                        "signature": row[4] or "",
-                        "created_at": row[5],
-                        "expired_at": row[6],
-                    })
+                    for row in rows
+                ]
                 
-                return (coupons, total)
+                return (coupons, total, next_keyset)
         
         return await self._run_in_thread(_query)
     
@@ -299,280 +898,159 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         def _query():
             with self._session_factory() as session:
                 # 쿠폰 기본 정보 및 관련 정보 조회 (삭제되지 않은 쿠폰만)
-                query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        c.register_id,
-                        c.use_log_id,
-                        c.register_log_id,
-                        p.product_name,
-                        pu.partner_id,
-                        pu.partner_name,
-                        m.member_id,
-                        m.member_name,
-                        DATE_FORMAT(m.member_birth, '%Y-%m-%d') as member_birth,
-                        DATE_FORMAT(c.created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                        DATE_FORMAT(c.expired_at, '%Y-%m-%d %H:%i:%s') as expired_at,
-                        DATE_FORMAT(rl.registered_at, '%Y-%m-%d %H:%i:%s') as registered_at,
-                        DATE_FORMAT(ul.used_at, '%Y-%m-%d %H:%i:%s') as used_at
-                    FROM coupons c
-                    INNER JOIN products p ON c.product_id = p.product_id
-                    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
-                    LEFT JOIN members m ON c.register_id = m.member_id
-                    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
-                    LEFT JOIN use_logs ul ON c.use_log_id = ul.use_log_id
-                    WHERE c.coupon_id = :coupon_id
-                      AND (rl.deleted_at IS NULL OR rl.register_log_id IS NULL)
-                    LIMIT 1
-                """)
-                
-                result = session.execute(query, {"coupon_id": coupon_id}).fetchone()
+                result = session.execute(_FIND_COUPON_DETAIL_SQL, {"coupon_id": coupon_id}).mappings().first()
                 
                 if result is None:
                     return None
                 
-                # 파트너 전화번호 조회
-                partner_id = result[5]  # partner_id는 인덱스 5
-                phone_query = text("""
-                    SELECT number
-                    FROM phones
-                    WHERE contact_account_type = 'PARTNER'
-                      AND account_id = :partner_id
-                    ORDER BY phone_id
-                """)
-                phone_results = session.execute(
-                    phone_query,
-                    {"partner_id": partner_id}
-                ).fetchall()
-                partner_phones = [row[0] for row in phone_results]
-                
                 return {
-                    "coupon_id": result[0],
-                    "register_id": result[1],
-                    "use_log_id": result[2],
-                    "register_log_id": result[3],
-                    "product_name": result[4],
-                    "partner_id": result[5],
-                    "partner_name": result[6],
-                    "partner_phones": partner_phones,
-                    "member_id": result[7],
-                    "member_name": result[8],
-                    "member_birth": result[9],
-                    "created_at": result[10],
-                    "expired_at": result[11],
-                    "registered_at": result[12],
-                    "used_at": result[13],
+                    "coupon_id": result["coupon_id"],
+                    "register_id": result["register_id"],
+                    "use_log_id": result["use_log_id"],
+                    "register_log_id": result["register_log_id"],
+                    "product_name": result["product_name"],
+                    "partner_id": result["partner_id"],
+                    "partner_name": result["partner_name"],
+                    "partner_phones": _parse_partner_phones(result["partner_phones"]),
+                    "member_id": result["member_id"],
+                    "member_name": result["member_name"],
+                    "member_birth": _format_date(result["member_birth"]),
+                    "created_at": _format_datetime(result["created_at"]),
+                    "expired_at": _format_datetime(result["expired_at"]),
+                    "registered_at": _format_datetime(result["registered_at"]),
+                    "used_at": _format_datetime(result["used_at"]),
+                    "is_used": bool(result["is_used"]),
                 }
         
-        return await self._run_in_thread(_query)
-    
-    async def validate_coupon_ownership(
-        self,
-        coupon_ids: list[int],
-        member_id: int,
-    ) -> tuple[list[int], list[int]]:
-        """쿠폰 소유권을 검증합니다."""
-        if not coupon_ids:
-            return ([], [])
+        inflight = self._coupon_detail_inflight.get(coupon_id)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
         
-        def _validate():
-            with self._session_factory() as session:
-                query = text("""
-                    SELECT coupon_id, register_id
-                    FROM coupons c
-                    WHERE c.coupon_id IN :coupon_ids
-                """)
-                result = session.execute(
-                    query,
-                    {"coupon_ids": tuple(coupon_ids)}
-                ).fetchall()
-                
-                valid_ids = []
-                invalid_ids = []
-                found_ids = {row[0] for row in result}
-                
-                for coupon_id in coupon_ids:
-                    if coupon_id not in found_ids:
-                        invalid_ids.append(coupon_id)
-                    else:
-                        # 소유권 확인
-                        row = next((r for r in result if r[0] == coupon_id), None)
-                        if row and row[1] == member_id:
-                            valid_ids.append(coupon_id)
-                        else:
-                            invalid_ids.append(coupon_id)
-                
-                return (valid_ids, invalid_ids)
-        
-        return await self._run_in_thread(_validate)
+        task = asyncio.ensure_future(self._run_in_thread(_query))
+        self._coupon_detail_inflight[coupon_id] = task
+        task.add_done_callback(lambda done: self._discard_coupon_detail_inflight(coupon_id, done))
+        # 먼저 요청한 쪽이 취소되어도 함께 대기 중인 요청은 결과를 받을 수 있도록 shield
+        return await asyncio.shield(task)
     
     async def mark_coupons_as_deleted(
         self,
         coupon_ids: list[int],
         member_id: int,
-    ) -> list[dict]:
-        """쿠폰들을 삭제 처리합니다 (register_logs에 deleted_at 기록)."""
+    ) -> tuple[list[dict], int]:
+        """
+        쿠폰들을 삭제 처리합니다 (register_logs와 coupons에 deleted_at 기록).
+        
+        본인이 등록한 쿠폰만 조회하여 소유권 검증을 함께 수행하며,
+        유효하지 않은 쿠폰이 하나라도 있으면 아무것도 삭제하지 않습니다.
+        """
         if not coupon_ids:
-            return []
+            return ([], 0)
         
         def _delete():
             with self._session_factory() as session:
-                # 삭제할 쿠폰들의 register_log_id 조회
-                query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        c.register_log_id,
-                        c.use_log_id,
-                        p.product_name,
-                        pu.partner_id,
-                        pu.partner_name,
-                        m.member_id,
-                        m.member_name,
-                        DATE_FORMAT(m.member_birth, '%Y-%m-%d') as member_birth,
-                        DATE_FORMAT(c.created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                        DATE_FORMAT(c.expired_at, '%Y-%m-%d %H:%i:%s') as expired_at,
-                        DATE_FORMAT(rl.registered_at, '%Y-%m-%d %H:%i:%s') as registered_at
-                    FROM coupons c
-                    INNER JOIN products p ON c.product_id = p.product_id
-                    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
-                    LEFT JOIN members m ON c.register_id = m.member_id
-                    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
-                    WHERE c.coupon_id IN :coupon_ids
-                      AND c.register_id = :member_id
-                """)
-                
+                # 삭제할 쿠폰들의 register_log_id 조회 (본인이 등록한 쿠폰만)
                 coupons = session.execute(
-                    query,
-                    {"coupon_ids": tuple(coupon_ids), "member_id": member_id}
-                ).fetchall()
+                    _SELECT_COUPONS_FOR_DELETE_SQL,
+                    {"coupon_ids": coupon_ids, "member_id": member_id}
+                ).mappings().all()
                 
-                if not coupons:
-                    return []
-                
-                # register_logs에 deleted_at 업데이트
-                register_log_ids = [row[1] for row in coupons if row[1] is not None]
-                if register_log_ids:
-                    update_query = text("""
-                        UPDATE register_logs
-                        SET deleted_at = CURRENT_TIMESTAMP
-                        WHERE register_log_id IN :register_log_ids
-                          AND deleted_at IS NULL
-                    """)
-                    session.execute(
-                        update_query,
-                        {"register_log_ids": tuple(register_log_ids)}
-                    )
+                # 존재하지 않거나 본인이 등록하지 않은 쿠폰 개수 (중복 ID 제거 기준)
+                invalid_count = len(set(coupon_ids)) - len(coupons)
+                if invalid_count:
+                    return ([], invalid_count)
+                
+                # register_logs와 coupons에 deleted_at 업데이트 (조회된 행을 다시 보내지 않고 JOIN UPDATE 한 번으로 처리)
+                session.execute(
+                    _MARK_COUPONS_DELETED_SQL,
+                    {"coupon_ids": coupon_ids, "member_id": member_id}
+                )
                 
                 # 사용하지 않은 쿠폰의 상세 정보 수집
+                unused_rows = [row for row in coupons if row["use_log_id"] is None]
                 unused_coupons = []
-                for row in coupons:
-                    coupon_id = row[0]
-                    use_log_id = row[2]
+                if unused_rows:
+                    member = session.execute(
+                        _FIND_DELETE_MEMBER_SQL,
+                        {"member_id": member_id}
+                    ).mappings().first()
+                    # LEFT JOIN과 같은 의미: 회원 정보가 없으면 None
+                    member_info = {
+                        "member_id": member["member_id"] if member else None,
+                        "member_name": member["member_name"] if member else None,
+                        "member_birth": _format_date(member["member_birth"]) if member else None,
+                    }
                     
-                    # 사용하지 않은 쿠폰만 수집
-                    if use_log_id is None:
-                        # 파트너 전화번호 조회
-                        partner_id = row[4]
-                        phone_query = text("""
-                            SELECT number
-                            FROM phones
-                            WHERE contact_account_type = 'PARTNER'
-                              AND account_id = :partner_id
-                            ORDER BY phone_id
-                        """)
-                        phone_results = session.execute(
-                            phone_query,
-                            {"partner_id": partner_id}
-                        ).fetchall()
-                        partner_phones = [p[0] for p in phone_results]
-                        
+                    for row in unused_rows:
                         unused_coupons.append({
-                            "coupon_id": coupon_id,
-                            "register_log_id": row[1],
-                            "product_name": row[3],
-                            "partner_id": partner_id,
-                            "partner_name": row[5],
-                            "partner_phones": partner_phones,
-                            "member_id": row[6],
-                            "member_name": row[7],
-                            "member_birth": row[8],
-                            "created_at": row[9],
-                            "expired_at": row[10],
-                            "registered_at": row[11],
+                            "coupon_id": row["coupon_id"],
+                            "register_log_id": row["register_log_id"],
+                            "product_name": row["product_name"],
+                            "partner_id": row["partner_id"],
+                            "partner_name": row["partner_name"],
+                            "partner_phones": _parse_partner_phones(row["partner_phones"]),
+                            **member_info,
+                            "created_at": _format_datetime(row["created_at"]),
+                            "expired_at": _format_datetime(row["expired_at"]),
+                            "registered_at": _format_datetime(row["registered_at"]),
                         })
                 
                 session.commit()
-                return unused_coupons
+                return (unused_coupons, 0)
         
-        return await self._run_in_thread(_delete)
+        result = await self._run_in_thread(_delete)
+        self._invalidate_coupon_detail(coupon_ids)
+        return result
     
     async def find_payment_logs_by_member_id(
         self,
         member_id: int,
         page: int,
         size: int,
-    ) -> Tuple[list[dict], int]:
+        cursor: tuple[datetime, int] | None = None,
+    ) -> tuple[list[dict], int | None, tuple[datetime, int] | None]:
         """회원 ID로 결제된 쿠폰의 사용 기록을 조회합니다."""
         def _query():
-            offset = (page - 1) * size
+            # 다음 페이지 존재 여부를 알 수 있도록 한 행을 더 조회
+            if cursor is None:
+                query = _FIND_PAYMENT_LOGS_SQL
+                params = {"member_id": member_id, "size": size + 1, "offset": (page - 1) * size}
+            else:
+                query = _FIND_PAYMENT_LOGS_AFTER_CURSOR_SQL
+                params = {"member_id": member_id, "size": size + 1, "cursor_used_at": cursor[0], "cursor_use_log_id": cursor[1]}
             
-            with self._session_factory() as session:
-                # 전체 개수 조회 (사용된 쿠폰만, 삭제되지 않은 쿠폰만)
-                count_query = text("""
-                    SELECT COUNT(*) as total
-                    FROM use_logs ul
-                    INNER JOIN coupons c ON ul.coupon_id = c.coupon_id
-                    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
-                    WHERE c.register_id = :member_id
-                      AND (rl.deleted_at IS NULL OR rl.register_log_id IS NULL)
-                """)
-                count_result = session.execute(count_query, {"member_id": member_id}).fetchone()
-                total = count_result[0] if count_result else 0
-                
-                # 사용 로그 목록 조회 (JOIN으로 쿠폰 정보 포함)
-                query = text("""
-                    SELECT 
-                        ul.use_log_id,
-                        c.coupon_id,
-                        p.product_name,
-                        pu.partner_name,
-                        DATE_FORMAT(c.created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                        DATE_FORMAT(c.expired_at, '%Y-%m-%d %H:%i:%s') as expired_at,
-                        DATE_FORMAT(ul.used_at, '%Y-%m-%d %H:%i:%s') as used_at
-                    FROM use_logs ul
-                    INNER JOIN coupons c ON ul.coupon_id = c.coupon_id
-                    INNER JOIN products p ON c.product_id = p.product_id
-                    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
-                    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
-                    WHERE c.register_id = :member_id
-                      AND (rl.deleted_at IS NULL OR rl.register_log_id IS NULL)
-                    ORDER BY ul.used_at DESC
-                    LIMIT :size OFFSET :offset
-                """)
+            with self._read_session_factory() as session:
+                rows = session.execute(query, params).mappings().all()
+                has_next = len(rows) > size
+                rows = rows[:size]
+                # 다음 페이지 커서는 표시용 문자열이 아닌 원본 정렬 값으로 생성
+                next_keyset = (rows[-1]["used_at"], rows[-1]["use_log_id"]) if has_next and rows else None
+                
+                if cursor is not None:
+                    # 커서 조회는 전체 개수를 다시 집계하지 않음 (첫 페이지의 개수를 커서로 전달받아 사용)
+                    total = None
+                elif rows:
+                    total = rows[0]["total"]
+                elif page > 1:
+                    # 범위를 벗어난 페이지는 윈도우 함수 결과가 없으므로 전체 개수를 별도로 조회
+                    total = session.execute(_COUNT_PAYMENT_LOGS_SQL, {"member_id": member_id}).scalar() or 0
+                else:
+                    total = 0
                 
-                result = session.execute(
-                    query,
+                # 결과를 딕셔너리 리스트로 변환
+                logs = [
                     {
-                        "member_id": member_id,
-                        "size": size,
-                        "offset": offset,
+                        "use_log_id": row["use_log_id"],
+                        "coupon_id": row["coupon_id"],
+                        "product_name": row["product_name"],
+                        "partner_name": row["partner_name"],
+                        "created_at": _format_datetime(row["created_at"]),
+                        "expired_at": _format_datetime(row["expired_at"]),
+                        "used_at": _format_datetime(row["used_at"]),
                     }
-                ).fetchall()
-                
-                # 결과를 딕셔너리 리스트로 변환
-                logs = []
-                for row in result:
-                    logs.append({
-                        "use_log_id": row[0],
-                        "coupon_id": row[1],
-                        "product_name": row[2],
-                        "partner_name": row[3],
-                        "created_at": row[4],
-                        "expired_at": row[5],
-                        "used_at": row[6],
-                    })
+                    for row in rows
+                ]
                 
-                return (logs, total)
+                return (logs, total, next_keyset)
         
         return await self._run_in_thread(_query)
     
@@ -583,36 +1061,21 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """등록코드로 쿠폰을 조회합니다."""
         def _query():
             with self._session_factory() as session:
-                query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        c.register_id,
-                        p.product_name,
-                        pu.partner_name,
-                        DATE_FORMAT(c.created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                        DATE_FORMAT(c.expired_at, '%Y-%m-%d %H:%i:%s') as expired_at
-                    FROM coupons c
-                    INNER JOIN products p ON c.product_id = p.product_id
-                    INNER JOIN partner_users pu ON c.partner_id = pu.partner_id
-                    WHERE c.registration_code = :registration_code
-                    LIMIT 1
-                """)
-                
                 result = session.execute(
-                    query,
+                    _FIND_COUPON_BY_REGISTRATION_CODE_SQL,
                     {"registration_code": registration_code}
-                ).fetchone()
+                ).mappings().first()
                 
                 if result is None:
                     return None
                 
                 return {
-                    "coupon_id": result[0],
-                    "register_id": result[1],
-                    "product_name": result[2],
-                    "partner_name": result[3],
-                    "created_at": result[4],
-                    "expired_at": result[5],
+                    "coupon_id": result["coupon_id"],
+                    "register_id": result["register_id"],
+                    "product_name": result["product_name"],
+                    "partner_name": result["partner_name"],
+                    "created_at": _format_datetime(result["created_at"]),
+                    "expired_at": _format_datetime(result["expired_at"]),
                 }
         
         return await self._run_in_thread(_query)
@@ -624,28 +1087,18 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """쿠폰 등록을 위해 쿠폰 ID로 쿠폰을 조회합니다."""
         def _query():
             with self._session_factory() as session:
-                query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        c.registration_code,
-                        c.register_id
-                    FROM coupons c
-                    WHERE c.coupon_id = :coupon_id
-                    LIMIT 1
-                """)
-                
                 result = session.execute(
-                    query,
+                    _FIND_COUPON_FOR_REGISTER_SQL,
                     {"coupon_id": coupon_id}
-                ).fetchone()
+                ).mappings().first()
                 
                 if result is None:
                     return None
                 
                 return {
-                    "coupon_id": result[0],
-                    "registration_code": result[1],
-                    "register_id": result[2],
+                    "coupon_id": result["coupon_id"],
+                    "registration_code": result["registration_code"],
+                    "register_id": result["register_id"],
                 }
         
         return await self._run_in_thread(_query)
@@ -660,16 +1113,10 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """쿠폰을 회원에게 등록합니다."""
         def _register():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 # register_logs에 등록 로그 생성
-                insert_log_query = text("""
-                    INSERT INTO register_logs (register_user_id, registered_at, created_at, updated_at)
-                    VALUES (:register_user_id, :registered_at, :created_at, :updated_at)
-                """)
                 now = now_kst()
                 result = session.execute(
-                    insert_log_query,
+                    _INSERT_REGISTER_LOG_SQL,
                     {
                         "register_user_id": member_id,
                         "registered_at": now,
@@ -680,15 +1127,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 register_log_id = result.lastrowid
                 
                 # coupons 테이블 업데이트 (register_id, register_log_id, signature_code)
-                update_query = text("""
-                    UPDATE coupons
-                    SET register_id = :member_id,
-                        register_log_id = :register_log_id,
-                        signature_code = :signature_code
-                    WHERE coupon_id = :coupon_id
-                """)
                 session.execute(
-                    update_query,
+                    _ASSIGN_COUPON_REGISTER_SQL,
                     {
                         "member_id": member_id,
                         "register_log_id": register_log_id,
@@ -699,7 +1139,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 
                 session.commit()
         
-        return await self._run_in_thread(_register)
+        await self._run_in_thread(_register)
+        self._invalidate_coupon_detail([coupon_id])
 
     async def find_issues_by_user(
         self,
@@ -725,67 +1166,30 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
             (이슈 목록, 전체 개수) 튜플
         """
         def _query():
-            with self._session_factory() as session:
-                offset = (page - 1) * size
-                
-                # WHERE 조건 구성
-                where_conditions = []
-                params = {
-                    "offset": offset,
-                    "size": size,
-                }
-                
-                # 권한 확인 조건
-                if subject_type == "member":
-                    # 개인사용자: vendor_id가 member_id와 일치하는 경우
-                    where_conditions.append("il.vendor_id = :subject_id")
-                    # 벤더가 삭제하지 않은 이슈만 조회 (soft delete 필터링)
-                    where_conditions.append("il.vendor_deleted_at IS NULL")
-                    params["subject_id"] = subject_id
-                elif subject_type == "partner":
-                    # 파트너사용자: partner_id가 일치하는 경우
-                    where_conditions.append("il.partner_id = :subject_id")
-                    # 파트너가 삭제하지 않은 이슈만 조회 (soft delete 필터링)
-                    where_conditions.append("il.partner_deleted_at IS NULL")
-                    params["subject_id"] = subject_id
-                else:
-                    # 알 수 없는 타입은 빈 결과 반환
-                    return ([], 0)
-                
-                # status 필터
-                if status:
-                    where_conditions.append("il.status = :status")
-                    params["status"] = status
-                
-                # title 검색 필터 (LIKE 검색)
-                if title:
-                    where_conditions.append("il.title LIKE :title")
-                    params["title"] = f"%{title}%"
-                
-                where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-                
+            # 알 수 없는 타입은 빈 결과 반환
+            if subject_type not in _ISSUE_SUBJECT_CONDITIONS:
+                return ([], 0)
+            
+            # 필터 조합별로 미리 만들어 둔 SQL 선택
+            count_query, query = _ISSUE_LIST_SQL_BY_FILTER[(subject_type, bool(status), bool(title))]
+            params = {
+                "subject_id": subject_id,
+                "offset": (page - 1) * size,
+                "size": size,
+            }
+            # status 필터
+            if status:
+                params["status"] = status
+            # title 검색 필터 (LIKE 검색)
+            if title:
+                params["title"] = f"%{title}%"
+            
+            with self._read_session_factory() as session:
                 # 전체 개수 조회
-                count_query = text(f"""
-                    SELECT COUNT(*)
-                    FROM issue_logs il
-                    WHERE {where_clause}
-                """)
                 count_result = session.execute(count_query, params).fetchone()
                 total = count_result[0] if count_result else 0
                 
                 # 이슈 목록 조회
-                query = text(f"""
-                    SELECT 
-                        il.issue_id,
-                        il.title,
-                        il.product_kind_count,
-                        il.status
-                    FROM issue_logs il
-                    WHERE {where_clause}
-                    ORDER BY il.requested_at DESC
-                    LIMIT :size OFFSET :offset
-                """)
-                
                 result = session.execute(query, params).fetchall()
                 
                 # 결과를 딕셔너리 리스트로 변환
@@ -824,162 +1228,42 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         if not issue_ids:
             return ([], [])
+        if subject_type not in _ISSUE_DELETE_LOOKUP_SQL_BY_SUBJECT:
+            # 알 수 없는 사용자 타입은 어떤 이슈에도 권한이 없음
+            return ([], list(issue_ids))
         
         def _delete():
             with self._session_factory() as session:
-                from libs.common import now_kst
                 try:
-                    # 이슈 정보 조회 (권한 확인 및 상태 확인용)
-                    # 이미 삭제된 이슈는 제외하고 조회
-                    query = text("""
-                        SELECT 
-                            il.issue_id,
-                            il.vendor_id,
-                            il.partner_id,
-                            il.status,
-                            il.vendor_deleted_at,
-                            il.partner_deleted_at
-                        FROM issue_logs il
-                        WHERE il.issue_id IN :issue_ids
-                    """)
-                    
-                    issues = session.execute(
-                        query,
-                        {"issue_ids": tuple(issue_ids)}
+                    # 해당 측에서 이미 삭제된 이슈는 제외하고 권한 여부와 함께 조회
+                    # (존재하지 않거나 이미 삭제된 이슈는 invalid로 처리하지 않고 무시)
+                    rows = session.execute(
+                        _ISSUE_DELETE_LOOKUP_SQL_BY_SUBJECT[subject_type],
+                        {
+                            "issue_ids": issue_ids,
+                            "subject_id": subject_id,
+                        }
                     ).fetchall()
                     
-                    # 조회된 이슈 ID와 요청된 이슈 ID 비교
-                    found_issue_ids = {issue[0] for issue in issues}
-                    not_found_issue_ids = [issue_id for issue_id in issue_ids if issue_id not in found_issue_ids]
-                    
-                    # 존재하지 않는 이슈는 invalid로 처리하지 않고 별도로 관리
-                    # (존재하지 않는 이슈는 무시하고, 권한이 없는 이슈만 에러 처리)
-                    
-                    # 권한 확인 및 상태별 처리
-                    valid_issue_ids = []
-                    invalid_issue_ids = []
-                    issues_to_delete_completely = []  # 완전 삭제할 이슈
-                    issues_to_soft_delete_vendor = []  # 벤더측에서만 삭제할 이슈
-                    issues_to_soft_delete_partner = []  # 파트너측에서만 삭제할 이슈
-                    issues_to_reject_and_delete = []  # 거절 처리 후 삭제할 이슈
+                    # 권한 확인 (권한이 없는 이슈만 에러 처리 대상)
+                    valid_issue_ids = [issue_id for issue_id, has_permission in rows if has_permission]
+                    invalid_issue_ids = [issue_id for issue_id, has_permission in rows if not has_permission]
                     
-                    # 승인 이전 상태 목록
-                    pending_statuses = ["ISSUE_STATUS/PENDING", "ISSUE_STATUS/PAYMENT_READY"]
-                    # 승인 이후 상태 목록
-                    approved_statuses = ["ISSUE_STATUS/ISSUED", "ISSUE_STATUS/SHARED", "ISSUE_STATUS/COMPLETED"]
-                    
-                    for issue in issues:
-                        issue_id, vendor_id, partner_id, status, vendor_deleted_at, partner_deleted_at = issue
-                        
-                        # 이미 삭제된 이슈인지 확인
-                        if subject_type == "member":
-                            # 개인사용자: vendor_deleted_at이 이미 설정되어 있으면 이미 삭제된 것
-                            if vendor_deleted_at is not None:
-                                # 이미 삭제된 이슈는 무시 (invalid로 처리하지 않음)
-                                continue
-                        elif subject_type == "partner":
-                            # 파트너사용자: partner_deleted_at이 이미 설정되어 있으면 이미 삭제된 것
-                            if partner_deleted_at is not None:
-                                # 이미 삭제된 이슈는 무시 (invalid로 처리하지 않음)
-                                continue
-                        
-                        # 권한 확인
-                        has_permission = False
-                        if subject_type == "member":
-                            # 개인사용자: vendor_id가 member_id와 일치하는 경우
-                            has_permission = (vendor_id == subject_id)
-                        elif subject_type == "partner":
-                            # 파트너사용자: partner_id가 일치하는 경우
-                            has_permission = (partner_id == subject_id)
-                        
-                        if not has_permission:
-                            invalid_issue_ids.append(issue_id)
-                            continue
-                        
-                        valid_issue_ids.append(issue_id)
-                        
-                        # 상태와 요청자에 따라 처리 분기
+                    if valid_issue_ids:
+                        params = {
+                            "issue_ids": valid_issue_ids,
+                            "subject_id": subject_id,
+                            "deleted_at": now_kst(),
+                        }
+                        # 상태와 요청자에 따라 처리 분기 (상태 분류는 WHERE/CASE 절에서 수행)
                         if subject_type == "member":
-                            # 벤더가 호출한 경우
-                            if status in pending_statuses:
-                                # 파트너 승인 이전: 파트너와 벤더측 모두에서 삭제 (=DB에서 삭제)
-                                issues_to_delete_completely.append(issue_id)
-                            elif status in approved_statuses:
-                                # 파트너 승인 이후: 벤더측에서만 삭제
-                                issues_to_soft_delete_vendor.append(issue_id)
-                        elif subject_type == "partner":
-                            # 파트너가 호출한 경우
-                            if status in pending_statuses:
-                                # 승인 이전: 벤더측에서는 거절로 처리되고 파트너측에서만 삭제
-                                issues_to_reject_and_delete.append(issue_id)
-                            elif status in approved_statuses:
-                                # 승인 이후: 파트너측에서만 삭제
-                                issues_to_soft_delete_partner.append(issue_id)
-                    
-                    now = now_kst()
-                    
-                    # 1. 완전 삭제 (벤더요청, 파트너 승인 이전)
-                    if issues_to_delete_completely:
-                        delete_query = text("""
-                            DELETE FROM issue_logs
-                            WHERE issue_id IN :issue_ids
-                        """)
-                        session.execute(
-                            delete_query,
-                            {"issue_ids": tuple(issues_to_delete_completely)}
-                        )
-                    
-                    # 2. 벤더측에서만 삭제 (벤더요청, 파트너 승인 이후)
-                    if issues_to_soft_delete_vendor:
-                        update_query = text("""
-                            UPDATE issue_logs
-                            SET vendor_deleted_at = :deleted_at
-                            WHERE issue_id IN :issue_ids
-                              AND vendor_deleted_at IS NULL
-                        """)
-                        session.execute(
-                            update_query,
-                            {
-                                "deleted_at": now,
-                                "issue_ids": tuple(issues_to_soft_delete_vendor)
-                            }
-                        )
-                    
-                    # 3. 파트너측에서만 삭제 (파트너요청, 승인 이후)
-                    if issues_to_soft_delete_partner:
-                        update_query = text("""
-                            UPDATE issue_logs
-                            SET partner_deleted_at = :deleted_at
-                            WHERE issue_id IN :issue_ids
-                              AND partner_deleted_at IS NULL
-                        """)
-                        session.execute(
-                            update_query,
-                            {
-                                "deleted_at": now,
-                                "issue_ids": tuple(issues_to_soft_delete_partner)
-                            }
-                        )
-                    
-                    # 4. 거절 처리 후 삭제 (파트너요청, 승인 이전)
-                    if issues_to_reject_and_delete:
-                        # status를 REJECTED로 변경하고 partner_deleted_at 설정
-                        update_query = text("""
-                            UPDATE issue_logs
-                            SET status = 'ISSUE_STATUS/REJECTED',
-                                partner_deleted_at = :deleted_at,
-                                decided_at = :decided_at
-                            WHERE issue_id IN :issue_ids
-                              AND partner_deleted_at IS NULL
-                        """)
-                        session.execute(
-                            update_query,
-                            {
-                                "deleted_at": now,
-                                "decided_at": now,
-                                "issue_ids": tuple(issues_to_reject_and_delete)
-                            }
-                        )
+                            # 벤더요청, 파트너 승인 이전: 파트너와 벤더측 모두에서 삭제 (=DB에서 삭제)
+                            session.execute(_DELETE_PENDING_ISSUES_FOR_VENDOR_SQL, params)
+                            # 벤더요청, 파트너 승인 이후: 벤더측에서만 삭제
+                            session.execute(_SOFT_DELETE_APPROVED_ISSUES_FOR_VENDOR_SQL, params)
+                        else:
+                            # 파트너요청: 승인 이전은 거절 처리 후 파트너측에서만 삭제, 승인 이후는 파트너측에서만 삭제
+                            session.execute(_SOFT_DELETE_ISSUES_FOR_PARTNER_SQL, params)
                     
                     session.commit()
                     return (valid_issue_ids, invalid_issue_ids)
@@ -1009,65 +1293,38 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
             (파트너 목록, 전체 개수) 튜플
         """
         def _query():
-            with self._session_factory() as session:
+            with self._read_session_factory() as session:
                 offset = (page - 1) * size
                 
-                # WHERE 조건 구성
-                where_conditions = ["p.contact_account_type = 'PARTNER'"]
                 params = {
                     "offset": offset,
                     "size": size,
                 }
-                
-                # keyword 필터 (파트너 상호명 LIKE 검색)
                 if keyword:
-                    where_conditions.append("pu.partner_name LIKE :keyword")
                     params["keyword"] = f"%{keyword}%"
                 
-                where_clause = " AND ".join(where_conditions)
-                
-                # 전체 개수 조회
-                count_query = text(f"""
-                    SELECT COUNT(DISTINCT pu.partner_id)
-                    FROM partner_users pu
-                    INNER JOIN phones p ON p.account_id = pu.partner_id
-                    WHERE {where_clause}
-                """)
-                count_result = session.execute(count_query, params).fetchone()
-                total = count_result[0] if count_result else 0
+                count_query, query = _PARTNER_SEARCH_SQL_BY_FILTER[bool(keyword)]
                 
-                # 파트너 목록 조회 (전화번호 포함)
-                # GROUP_CONCAT을 사용하여 여러 전화번호를 하나의 문자열로 합침
-                query = text(f"""
-                    SELECT 
-                        pu.partner_id,
-                        pu.partner_name,
-                        GROUP_CONCAT(p.number ORDER BY p.number SEPARATOR ', ') as numbers
-                    FROM partner_users pu
-                    INNER JOIN phones p ON p.account_id = pu.partner_id
-                    WHERE {where_clause}
-                    GROUP BY pu.partner_id, pu.partner_name
-                    ORDER BY pu.partner_name ASC
-                    LIMIT :size OFFSET :offset
-                """)
+                # 파트너 목록 조회 (번호 순 첫 번째 전화번호 포함, 전체 개수는 윈도우 함수로 함께 계산)
+                rows = session.execute(query, params).mappings().all()
                 
-                result = session.execute(query, params).fetchall()
+                if rows:
+                    total = rows[0]["total"]
+                elif offset > 0:
+                    # 범위를 벗어난 페이지는 전체 개수를 별도로 조회
+                    total = session.execute(count_query, params).scalar() or 0
+                else:
+                    total = 0
                 
                 # 결과를 딕셔너리 리스트로 변환
-                partners = []
-                for row in result:
-                    # 전화번호가 여러 개인 경우 첫 번째 것만 사용하거나, 모두 표시
-                    # 요구사항에 따르면 "numbers"는 단수형이지만 여러 개일 수 있으므로
-                    # 첫 번째 전화번호만 사용하거나, 쉼표로 구분된 문자열 사용
-                    phone_numbers = row[2] if row[2] else ""
-                    # 첫 번째 전화번호만 사용 (요구사항에 "numbers"가 단수형이므로)
-                    first_phone = phone_numbers.split(',')[0].strip() if phone_numbers else ""
-                    
-                    partners.append({
-                        "partner_id": row[0],
-                        "partner_name": row[1],
-                        "numbers": first_phone,
-                    })
+                partners = [
+                    {
+                        "partner_id": row["partner_id"],
+                        "partner_name": row["partner_name"],
+                        "numbers": row["number"] or "",
+                    }
+                    for row in rows
+                ]
                 
                 return (partners, total)
         
@@ -1093,53 +1350,38 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
             (상품 목록, 전체 개수) 튜플
         """
         def _query():
-            with self._session_factory() as session:
+            with self._read_session_factory() as session:
                 offset = (page - 1) * size
                 
-                # WHERE 조건 구성
-                where_conditions = ["p.partner_id = :partner_id"]
                 params = {
                     "partner_id": partner_id,
                     "offset": offset,
                     "size": size,
                 }
-                
-                # keyword 필터 (상품명 LIKE 검색)
                 if keyword:
-                    where_conditions.append("p.product_name LIKE :keyword")
                     params["keyword"] = f"%{keyword}%"
                 
-                where_clause = " AND ".join(where_conditions)
+                count_query, query = _PRODUCT_SEARCH_SQL_BY_FILTER[bool(keyword)]
                 
-                # 전체 개수 조회
-                count_query = text(f"""
-                    SELECT COUNT(*)
-                    FROM products p
-                    WHERE {where_clause}
-                """)
-                count_result = session.execute(count_query, params).fetchone()
-                total = count_result[0] if count_result else 0
+                # 상품 목록 조회 (전체 개수는 윈도우 함수로 함께 계산)
+                rows = session.execute(query, params).mappings().all()
                 
-                # 상품 목록 조회
-                query = text(f"""
-                    SELECT 
-                        p.product_id,
-                        p.product_name
-                    FROM products p
-                    WHERE {where_clause}
-                    ORDER BY p.product_name ASC
-                    LIMIT :size OFFSET :offset
-                """)
-                
-                result = session.execute(query, params).fetchall()
+                if rows:
+                    total = rows[0]["total"]
+                elif offset > 0:
+                    # 범위를 벗어난 페이지는 전체 개수를 별도로 조회
+                    total = session.execute(count_query, params).scalar() or 0
+                else:
+                    total = 0
                 
                 # 결과를 딕셔너리 리스트로 변환
-                products = []
-                for row in result:
-                    products.append({
-                        "product_id": row[0],
-                        "product_name": row[1],
-                    })
+                products = [
+                    {
+                        "product_id": row["product_id"],
+                        "product_name": row["product_name"],
+                    }
+                    for row in rows
+                ]
                 
                 return (products, total)
         
@@ -1177,8 +1419,6 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _create():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 now = now_kst()
                 
                 # 1. 파트너 처리
@@ -1200,11 +1440,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                         raise ValueError("ERR-IVD-VALUE")
                     
                     # 파트너 존재 확인
-                    check_query = text("""
-                        SELECT partner_id FROM partner_users WHERE partner_id = :partner_id
-                    """)
                     check_result = session.execute(
-                        check_query,
+                        _FIND_PARTNER_ID_SQL,
                         {"partner_id": partner_id}
                     ).fetchone()
                     
@@ -1215,6 +1452,7 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 
                 # 2. 상품 처리 및 product 정보 수집
                 product_info_list = []  # [{"product_id": int | None, "product_name": str | None, "count": int}]
+                existing_product_ids = []  # 소유 확인이 필요한 기존 상품 ID
                 product_kind_count = len(products)
                 requested_issue_count = 0
                 
@@ -1249,12 +1487,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                             if not product_name:
                                 raise ValueError("ERR-IVD-VALUE")
                             
-                            product_query = text("""
-                                INSERT INTO products (partner_id, product_name, created_at)
-                                VALUES (:partner_id, :product_name, :created_at)
-                            """)
                             result = session.execute(
-                                product_query,
+                                _INSERT_PRODUCT_SQL,
                                 {
                                     "partner_id": final_partner_id,
                                     "product_name": product_name,
@@ -1273,46 +1507,34 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                             if product_id is None:
                                 raise ValueError("ERR-IVD-VALUE")
                             
-                            # 상품 존재 및 파트너 소유 확인
-                            check_query = text("""
-                                SELECT product_id FROM products 
-                                WHERE product_id = :product_id AND partner_id = :partner_id
-                            """)
-                            check_result = session.execute(
-                                check_query,
-                                {
-                                    "product_id": product_id,
-                                    "partner_id": final_partner_id,
-                                }
-                            ).fetchone()
-                            
-                            if check_result is None:
-                                raise ValueError("ERR-IVD-VALUE")
-                            
+                            # 상품 존재 및 파트너 소유 확인은 루프 이후 한 번에 수행
+                            existing_product_ids.append(product_id)
                             product_info_list.append({
                                 "product_id": product_id,
                                 "product_name": None,
                                 "count": count,
                             })
                 
+                if existing_product_ids:
+                    # 선택한 기존 상품이 모두 존재하고 해당 파트너 소유인지 한 번의 조회로 확인
+                    owned_product_ids = set(session.execute(
+                        _FIND_PARTNER_PRODUCT_IDS_SQL,
+                        {
+                            "partner_id": final_partner_id,
+                            "product_ids": existing_product_ids,
+                        }
+                    ).scalars())
+                    if not owned_product_ids.issuperset(existing_product_ids):
+                        raise ValueError("ERR-IVD-VALUE")
+                
                 # 3. IssueLog 생성
                 # 신규 파트너인 경우 partner_name도 저장
                 final_partner_name = None
                 if partner_is_new:
                     final_partner_name = partner_name
                 
-                issue_query = text("""
-                    INSERT INTO issue_logs (
-                        title, product_kind_count, requested_issue_count, approved_issue_count,
-                        requested_at, valid_days, status, vendor_id, partner_id, partner_phone, partner_name, created_at
-                    )
-                    VALUES (
-                        :title, :product_kind_count, :requested_issue_count, 0,
-                        :requested_at, :valid_days, 'ISSUE_STATUS/PENDING', :vendor_id, :partner_id, :partner_phone, :partner_name, :created_at
-                    )
-                """)
                 result = session.execute(
-                    issue_query,
+                    _INSERT_ISSUE_REQUEST_SQL,
                     {
                         "title": title,
                         "product_kind_count": product_kind_count,
@@ -1328,22 +1550,21 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 )
                 issue_id = result.lastrowid
                 
-                # 4. IssueProduct 생성 (stage는 REQUEST)
-                for item in product_info_list:
-                    issue_product_query = text("""
-                        INSERT INTO issue_products (issue_id, product_id, product_name, stage, count, created_at)
-                        VALUES (:issue_id, :product_id, :product_name, 'REQUEST', :count, :created_at)
-                    """)
-                    session.execute(
-                        issue_product_query,
+                # 4. IssueProduct 생성 (stage는 REQUEST, 전체 상품을 한 번에 INSERT)
+                session.execute(
+                    _INSERT_ISSUE_PRODUCTS_SQL,
+                    [
                         {
                             "issue_id": issue_id,
                             "product_id": item["product_id"],
                             "product_name": item["product_name"],
+                            "stage": "REQUEST",
                             "count": item["count"],
                             "created_at": now,
                         }
-                    )
+                        for item in product_info_list
+                    ]
+                )
                 
                 session.commit()
                 return issue_id
@@ -1364,18 +1585,10 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _map():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 # 1. issue_logs에서 partner_phone이 일치하고 partner_id가 NULL인 레코드 찾기
                 # 2. partner_id 업데이트
-                update_issue_query = text("""
-                    UPDATE issue_logs
-                    SET partner_id = :partner_id
-                    WHERE partner_phone = :partner_phone
-                      AND partner_id IS NULL
-                """)
                 session.execute(
-                    update_issue_query,
+                    _ASSIGN_PARTNER_TO_ISSUES_SQL,
                     {
                         "partner_id": partner_id,
                         "partner_phone": partner_phone,
@@ -1384,32 +1597,18 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 
                 # 3. issue_products에서 product_id가 NULL인 레코드 찾기
                 # 4. products 생성하고 product_id 업데이트
-                # 먼저 issue_product_id와 product_name 목록 가져오기
-                issue_products_query = text("""
-                    SELECT ip.issue_product_id, ip.issue_id, ip.product_name, ip.count
-                    FROM issue_products ip
-                    INNER JOIN issue_logs il ON ip.issue_id = il.issue_id
-                    WHERE il.partner_id = :partner_id
-                      AND ip.product_id IS NULL
-                      AND ip.product_name IS NOT NULL
-                    ORDER BY ip.issue_product_id
-                """)
                 issue_products = session.execute(
-                    issue_products_query,
+                    _FIND_PENDING_ISSUE_PRODUCTS_SQL,
                     {"partner_id": partner_id}
                 ).fetchall()
                 
                 now = now_kst()
                 
                 # 각 상품 생성 및 매핑
-                for issue_product_id, issue_id, product_name, count in issue_products:
+                for issue_product_id, product_name in issue_products:
                     # 상품 생성
-                    product_query = text("""
-                        INSERT INTO products (partner_id, product_name, created_at)
-                        VALUES (:partner_id, :product_name, :created_at)
-                    """)
                     result = session.execute(
-                        product_query,
+                        _INSERT_PRODUCT_SQL,
                         {
                             "partner_id": partner_id,
                             "product_name": product_name,
@@ -1419,13 +1618,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                     product_id = result.lastrowid
                     
                     # issue_products의 product_id 업데이트 (issue_product_id로 정확히 매핑)
-                    update_product_query = text("""
-                        UPDATE issue_products
-                        SET product_id = :product_id
-                        WHERE issue_product_id = :issue_product_id
-                    """)
                     session.execute(
-                        update_product_query,
+                        _ASSIGN_ISSUE_PRODUCT_SQL,
                         {
                             "product_id": product_id,
                             "issue_product_id": issue_product_id,
@@ -1455,163 +1649,65 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _query():
             with self._session_factory() as session:
-                # 권한 확인 조건
-                permission_condition = ""
-                if subject_type == "member":
-                    permission_condition = "il.vendor_id = :subject_id AND il.vendor_deleted_at IS NULL"
-                elif subject_type == "partner":
-                    permission_condition = "il.partner_id = :subject_id AND il.partner_deleted_at IS NULL"
-                else:
+                # 권한 확인 조건에 맞는 발행기록 조회 SQL
+                query = _ISSUE_REQUEST_SQL_BY_SUBJECT.get(subject_type)
+                if query is None:
                     return None
                 
-                # 발행기록 기본 정보 조회 (권한 체크 포함)
-                query = text(f"""
-                    SELECT 
-                        il.issue_id,
-                        il.title,
-                        il.status,
-                        il.vendor_id,
-                        il.partner_id,
-                        il.partner_phone,
-                        il.partner_name,
-                        il.requested_at
-                    FROM issue_logs il
-                    WHERE il.issue_id = :issue_id
-                      AND {permission_condition}
-                """)
-
+                # 발행기록 기본 정보와 벤더/파트너 정보를 한 번에 조회 (권한 체크 포함)
                 result = session.execute(
                     query,
                     {
                         "issue_id": issue_id,
                         "subject_id": subject_id,
                     }
-                ).fetchone()
-
-                if not result:
-                    return None;
-
-                issue_id_val, title, status, vendor_id, partner_id, partner_phone, partner_name, requested_at = result
-
-                # 파트너 정보 조회 (nullable)
-                partner_info = None
-                if partner_id:
-                    partner_query = text("""
-                        SELECT 
-                            pu.partner_id,
-                            pu.partner_name,
-                            (SELECT p.number 
-                             FROM phones p 
-                             WHERE p.contact_account_type = 'PARTNER' 
-                               AND p.account_id = pu.partner_id 
-                             ORDER BY p.phone_id
-                             LIMIT 1) as partner_phone
-                        FROM partner_users pu
-                        WHERE pu.partner_id = :partner_id
-                    """)
-                    
-                    partner_result = session.execute(
-                        partner_query,
-                        {"partner_id": partner_id}
-                    ).fetchone()
-                    
-                    if partner_result:
-                        partner_info = {
-                            "partner_id": partner_result[0],
-                            "partner_name": partner_result[1],
-                            "number": partner_result[2] if partner_result[2] else None,
-                        }
+                ).mappings().first()
                 
-                # 파트너가 아직 가입하지 않은 경우 partner_phone과 partner_name 사용
-                if not partner_info and partner_phone:
-                    partner_info = {
-                        "partner_id": None,
-                        "partner_name": partner_name if partner_name else None,
-                        "number": partner_phone,
-                    }
+                if not result:
+                    return None
                 
                 # 상품 목록 조회
-                products_query = text("""
-                    SELECT 
-                        ip.product_id,
-                        COALESCE(ip.product_name, p.product_name) as product_name,
-                        ip.count
-                    FROM issue_products ip
-                    LEFT JOIN products p ON ip.product_id = p.product_id
-                    WHERE ip.issue_id = :issue_id
-                      AND ip.stage = 'REQUEST'
-                    ORDER BY ip.issue_product_id
-                """)
-                
                 products_result = session.execute(
-                    products_query,
+                    _FIND_ISSUE_REQUEST_PRODUCTS_SQL,
                     {"issue_id": issue_id}
                 ).fetchall()
                 
-                products = []
-                for product_row in products_result:
-                    products.append({
-                        "product_id": product_row[0],
-                        "product_name": product_row[1],
-                        "count": product_row[2],
-                    })
-                
-                # 벤더(회원) 정보 조회
-                vendor_query = text("""
-                    SELECT 
-                        m.member_id,
-                        m.member_name,
-                        (SELECT p.number 
-                         FROM phones p 
-                         WHERE p.contact_account_type = 'MEMBER' 
-                           AND p.account_id = m.member_id 
-                         LIMIT 1) as vendor_phone
-                    FROM members m
-                    WHERE m.member_id = :vendor_id
-                """)
-                
-                vendor_result = session.execute(
-                    vendor_query,
-                    {"vendor_id": vendor_id}
-                ).fetchone()
-                
-                if not vendor_result:
-                    return {
-                        "issue_id": issue_id_val,
-                        "title": title,
-                        "status": status,
-                        "vendor": {
-                            "member_id": 1,
-                            "member_name": "",
-                            "number": ""
-                        },
-                        "partner": partner_info or {
-                            "partner_id": None,
-                            "partner_name": None,
-                            "number": None,
-                        },
-                        "products": products,
-                        "requested_at": requested_at,
+                products = [
+                    {
+                        "product_id": product_id,
+                        "product_name": product_name,
+                        "count": count,
                     }
+                    for product_id, product_name, count in products_result
+                ]
                 
-                vendor_member_id, vendor_member_name, vendor_phone = vendor_result
+                # 벤더(회원) 정보
+                if result["vendor_member_id"] is None:
+                    vendor_info = {
+                        "member_id": 1,
+                        "member_name": "",
+                        "number": ""
+                    }
+                else:
+                    vendor_info = {
+                        "member_id": result["vendor_member_id"],
+                        "member_name": result["vendor_member_name"],
+                        "number": result["vendor_phone"] if result["vendor_phone"] else "",
+                    }
                 
                 return {
-                    "issue_id": issue_id_val,
-                    "title": title,
-                    "status": status,
-                    "vendor": {
-                        "member_id": vendor_member_id,
-                        "member_name": vendor_member_name,
-                        "number": vendor_phone if vendor_phone else "",
-                    },
-                    "partner": partner_info or {
-                        "partner_id": None,
-                        "partner_name": None,
-                        "number": None,
+                    "issue_id": result["issue_id"],
+                    "title": result["title"],
+                    "status": result["status"],
+                    "vendor": vendor_info,
+                    # 미가입 파트너 대체 값은 SQL에서 반영됨
+                    "partner": {
+                        "partner_id": result["partner_user_id"],
+                        "partner_name": result["partner_display_name"],
+                        "number": result["partner_display_number"],
                     },
                     "products": products,
-                    "requested_at": requested_at,
+                    "requested_at": result["requested_at"],
                 }
         
         return await self._run_in_thread(_query)
@@ -1638,49 +1734,24 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _query():
             with self._session_factory() as session:
-                # 권한 확인 조건
-                permission_condition = ""
-                if subject_type == "member":
-                    permission_condition = "il.vendor_id = :subject_id AND il.vendor_deleted_at IS NULL"
-                elif subject_type == "partner":
-                    permission_condition = "il.partner_id = :subject_id AND il.partner_deleted_at IS NULL"
-                else:
+                # 권한 확인 조건에 맞는 발행기록 조회 SQL
+                query = _ISSUE_DECISION_SQL_BY_SUBJECT.get(subject_type)
+                if query is None:
                     return None
                 
-                # 발행기록 기본 정보 조회 (권한 체크 포함)
-                query = text(f"""
-                    SELECT 
-                        il.issue_id,
-                        il.status,
-                        il.requested_issue_count,
-                        il.approved_issue_count,
-                        il.valid_days,
-                        il.vendor_id,
-                        il.partner_id,
-                        il.partner_phone,
-                        il.partner_name,
-                        il.requested_at,
-                        il.decided_at,
-                        il.reason
-                    FROM issue_logs il
-                    WHERE il.issue_id = :issue_id
-                      AND {permission_condition}
-                """)
-                
+                # 발행기록 기본 정보와 벤더/파트너 정보를 한 번에 조회 (권한 체크 포함)
                 result = session.execute(
                     query,
                     {
                         "issue_id": issue_id,
                         "subject_id": subject_id,
                     }
-                ).fetchone()
+                ).mappings().first()
                 
                 if not result:
                     return None
                 
-                (issue_id_val, status, requested_issue_count, approved_issue_count, 
-                 valid_days, vendor_id, partner_id, partner_phone, partner_name,
-                 requested_at, decided_at, reason) = result
+                status = result["status"]
                 
                 # 상태 확인
                 approved_statuses = ["ISSUE_STATUS/ISSUED", "ISSUE_STATUS/SHARED", "ISSUE_STATUS/COMPLETED"]
@@ -1691,35 +1762,16 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 if status in pending_statuses:
                     return {"status": "PENDING"}
                 
-                if vendor_id is not None:
-                    # 벤더(회원) 정보 조회
-                    vendor_query = text("""
-                        SELECT 
-                            m.member_id,
-                            m.member_name,
-                            (SELECT p.number 
-                            FROM phones p 
-                            WHERE p.contact_account_type = 'MEMBER' 
-                            AND p.account_id = m.member_id 
-                            LIMIT 1) as vendor_phone
-                        FROM members m
-                        WHERE m.member_id = :vendor_id
-                    """)
-                    
-                    vendor_result = session.execute(
-                        vendor_query,
-                        {"vendor_id": vendor_id}
-                    ).fetchone()
-                    
-                    if not vendor_result:
+                # 벤더(회원) 정보
+                if result["vendor_id"] is not None:
+                    # 벤더 회원이 존재하지 않는 경우
+                    if result["vendor_member_id"] is None:
                         return None
                     
-                    vendor_member_id, vendor_member_name, vendor_phone = vendor_result
-                    
                     vendor_info = {
-                        "member_id": vendor_member_id,
-                        "member_name": vendor_member_name,
-                        "number": vendor_phone if vendor_phone else "",
+                        "member_id": result["vendor_member_id"],
+                        "member_name": result["vendor_member_name"],
+                        "number": result["vendor_phone"] if result["vendor_phone"] else "",
                     }
                 else:
                     vendor_info = {
@@ -1730,96 +1782,49 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 
                 # 승인된 경우
                 if status in approved_statuses:
-                    # 파트너 정보 조회
-                    partner_info = None
-                    if partner_id:
-                        partner_query = text("""
-                            SELECT 
-                                pu.partner_id,
-                                pu.partner_name,
-                                (SELECT p.number 
-                                 FROM phones p 
-                                 WHERE p.contact_account_type = 'PARTNER' 
-                                   AND p.account_id = pu.partner_id 
-                                 ORDER BY p.phone_id
-                                 LIMIT 1) as partner_phone
-                            FROM partner_users pu
-                            WHERE pu.partner_id = :partner_id
-                        """)
-                        
-                        partner_result = session.execute(
-                            partner_query,
-                            {"partner_id": partner_id}
-                        ).fetchone()
-                        
-                        if partner_result:
-                            partner_info = {
-                                "partner_id": partner_result[0],
-                                "partner_name": partner_result[1],
-                                "number": partner_result[2] if partner_result[2] else None,
-                            }
-                    
-                    # 파트너가 아직 가입하지 않은 경우 partner_phone과 partner_name 사용
-                    if not partner_info and partner_phone:
-                        partner_info = {
-                            "partner_id": None,
-                            "partner_name": partner_name if partner_name else None,
-                            "number": partner_phone,
-                        }
-                    
                     # 승인된 상품 목록 조회 (stage='APPROVE')
-                    products_query = text("""
-                        SELECT 
-                            ip.product_id,
-                            COALESCE(ip.product_name, p.product_name) as product_name,
-                            ip.count
-                        FROM issue_products ip
-                        LEFT JOIN products p ON ip.product_id = p.product_id
-                        WHERE ip.issue_id = :issue_id
-                          AND ip.stage = 'APPROVE'
-                        ORDER BY ip.issue_product_id
-                    """)
-                    
                     products_result = session.execute(
-                        products_query,
+                        _FIND_ISSUE_APPROVED_PRODUCTS_SQL,
                         {"issue_id": issue_id}
                     ).fetchall()
                     
-                    products = []
-                    for product_row in products_result:
-                        products.append({
-                            "product_id": product_row[0],
-                            "product_name": product_row[1],
-                            "count": product_row[2],
-                        })
+                    products = [
+                        {
+                            "product_id": product_id,
+                            "product_name": product_name,
+                            "count": count,
+                        }
+                        for product_id, product_name, count in products_result
+                    ]
                     
                     return {
                         "status": "APPROVED",
-                        "requested_issue_count": requested_issue_count,
-                        "approved_issue_count": approved_issue_count,
-                        "valid_days": valid_days,
+                        "requested_issue_count": result["requested_issue_count"],
+                        "approved_issue_count": result["approved_issue_count"],
+                        "valid_days": result["valid_days"],
                         "vendor": vendor_info,
-                        "partner": partner_info or {
-                            "partner_id": None,
-                            "partner_name": None,
-                            "number": None,
+                        # 미가입 파트너 대체 값은 SQL에서 반영됨
+                        "partner": {
+                            "partner_id": result["partner_user_id"],
+                            "partner_name": result["partner_display_name"],
+                            "number": result["partner_display_number"],
                         },
                         "products": products,
-                        "requested_at": requested_at,
-                        "decided_at": decided_at,
+                        "requested_at": result["requested_at"],
+                        "decided_at": result["decided_at"],
                     }
                 
                 # 반려된 경우
                 elif status == rejected_status:
                     # 반려 사유는 DB에서 조회 (없으면 기본 메시지)
-                    reason_text = reason if reason else "파트너에 의해 반려되었습니다."
+                    reason_text = result["reason"] if result["reason"] else "파트너에 의해 반려되었습니다."
                     
                     return {
                         "status": "REJECTED",
-                        "requested_issue_count": requested_issue_count,
+                        "requested_issue_count": result["requested_issue_count"],
                         "reason": reason_text,
-                        "requested_at": requested_at,
-                        "decided_at": decided_at,
+                        "requested_at": result["requested_at"],
+                        "decided_at": result["decided_at"],
                     }
                 
                 # 알 수 없는 상태
@@ -1851,29 +1856,11 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _decide():
             with self._session_factory() as session:
-                from datetime import timedelta
-                from libs.common import now_kst
-                import random
-                
                 now = now_kst()
                 
                 # 1. 발행기록 조회 및 권한 확인
-                issue_query = text("""
-                    SELECT 
-                        il.issue_id,
-                        il.status,
-                        il.partner_id,
-                        il.vendor_id,
-                        il.valid_days,
-                        il.requested_issue_count
-                    FROM issue_logs il
-                    WHERE il.issue_id = :issue_id
-                      AND il.partner_id = :partner_id
-                      AND il.partner_deleted_at IS NULL
-                """)
-                
                 issue_result = session.execute(
-                    issue_query,
+                    _FIND_ISSUE_FOR_DECIDE_SQL,
                     {
                         "issue_id": issue_id,
                         "partner_id": partner_id,
@@ -1914,12 +1901,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                             if not product_name:
                                 raise ValueError("ERR-IVD-VALUE")
                             
-                            product_insert_query = text("""
-                                INSERT INTO products (partner_id, product_name, created_at)
-                                VALUES (:partner_id, :product_name, :created_at)
-                            """)
                             product_result = session.execute(
-                                product_insert_query,
+                                _INSERT_PRODUCT_SQL,
                                 {
                                     "partner_id": partner_id,
                                     "product_name": product_name,
@@ -1933,12 +1916,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                                 raise ValueError("ERR-IVD-VALUE")
                             
                             # 상품 존재 및 파트너 소유 확인
-                            check_query = text("""
-                                SELECT product_id FROM products 
-                                WHERE product_id = :product_id AND partner_id = :partner_id
-                            """)
                             check_result = session.execute(
-                                check_query,
+                                _FIND_PARTNER_PRODUCT_SQL,
                                 {
                                     "product_id": product_id,
                                     "partner_id": partner_id,
@@ -1956,17 +1935,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                         original_product_name = None
                         if is_new:
                             # 신규 상품: REQUEST stage에서 product_name으로 찾아서 원본 이름 가져오기
-                            find_request_query = text("""
-                                SELECT product_name
-                                FROM issue_products
-                                WHERE issue_id = :issue_id
-                                  AND stage = 'REQUEST'
-                                  AND product_id IS NULL
-                                  AND product_name = :product_name
-                                LIMIT 1
-                            """)
                             request_result = session.execute(
-                                find_request_query,
+                                _FIND_REQUESTED_NEW_PRODUCT_NAME_SQL,
                                 {
                                     "issue_id": issue_id,
                                     "product_name": product_name,
@@ -1977,18 +1947,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                         else:
                             # 기존 상품: REQUEST stage에서 product_id로 찾아서 원본 이름 가져오기
                             # product_name이 NULL이면 products 테이블에서 가져오기
-                            find_request_query = text("""
-                                SELECT 
-                                    COALESCE(ip.product_name, p.product_name) as product_name
-                                FROM issue_products ip
-                                LEFT JOIN products p ON ip.product_id = p.product_id
-                                WHERE ip.issue_id = :issue_id
-                                  AND ip.stage = 'REQUEST'
-                                  AND ip.product_id = :product_id
-                                LIMIT 1
-                            """)
                             request_result = session.execute(
-                                find_request_query,
+                                _FIND_REQUESTED_PRODUCT_NAME_SQL,
                                 {
                                     "issue_id": issue_id,
                                     "product_id": final_product_id,
@@ -1998,12 +1958,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                                 original_product_name = request_result[0]
                         
                         # 새로운 IssueProduct 생성 (stage='APPROVE')
-                        issue_product_insert_query = text("""
-                            INSERT INTO issue_products (issue_id, product_id, product_name, stage, count, created_at)
-                            VALUES (:issue_id, :product_id, :product_name, 'APPROVE', :count, :created_at)
-                        """)
                         session.execute(
-                            issue_product_insert_query,
+                            _INSERT_APPROVED_ISSUE_PRODUCT_SQL,
                             {
                                 "issue_id": issue_id,
                                 "product_id": final_product_id,
@@ -2020,27 +1976,14 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                             registration_code = ''.join([str(random.randint(0, 9)) for _ in range(10)])
                             
                             # 중복 확인 (매우 드물지만)
-                            check_code_query = text("""
-                                SELECT coupon_id FROM coupons WHERE registration_code = :registration_code
-                            """)
                             while session.execute(
-                                check_code_query,
+                                _FIND_COUPON_ID_BY_REGISTRATION_CODE_SQL,
                                 {"registration_code": registration_code}
                             ).fetchone():
                                 registration_code = ''.join([str(random.randint(0, 9)) for _ in range(10)])
                             
-                            coupon_insert_query = text("""
-                                INSERT INTO coupons (
-                                    issue_id, product_id, registration_code, partner_id,
-                                    created_at, expired_at
-                                )
-                                VALUES (
-                                    :issue_id, :product_id, :registration_code, :partner_id,
-                                    :created_at, :expired_at
-                                )
-                            """)
                             session.execute(
-                                coupon_insert_query,
+                                _INSERT_ISSUED_COUPON_SQL,
                                 {
                                     "issue_id": issue_id,
                                     "product_id": final_product_id,
@@ -2052,16 +1995,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                             )
                     
                     # 발행기록 상태 업데이트
-                    update_issue_query = text("""
-                        UPDATE issue_logs
-                        SET status = 'ISSUE_STATUS/ISSUED',
-                            decided_at = :decided_at,
-                            approved_issue_count = :approved_issue_count,
-                            product_kind_count = :product_kind_count
-                        WHERE issue_id = :issue_id
-                    """)
                     session.execute(
-                        update_issue_query,
+                        _MARK_ISSUE_ISSUED_SQL,
                         {
                             "issue_id": issue_id,
                             "decided_at": now,
@@ -2076,15 +2011,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                         raise ValueError("ERR-IVD-VALUE")
                     
                     # 발행기록 상태 업데이트 (reason 포함)
-                    update_issue_query = text("""
-                        UPDATE issue_logs
-                        SET status = 'ISSUE_STATUS/REJECTED',
-                            decided_at = :decided_at,
-                            reason = :reason
-                        WHERE issue_id = :issue_id
-                    """)
                     session.execute(
-                        update_issue_query,
+                        _MARK_ISSUE_REJECTED_SQL,
                         {
                             "issue_id": issue_id,
                             "decided_at": now,
@@ -2120,18 +2048,11 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _create():
             with self._session_factory() as session:
-                from datetime import timedelta
-                from libs.common import now_kst
-                import random
-                
                 now = now_kst()
                 
                 # 1. 파트너 존재 확인
-                check_query = text("""
-                    SELECT partner_id FROM partner_users WHERE partner_id = :partner_id
-                """)
                 check_result = session.execute(
-                    check_query,
+                    _FIND_PARTNER_ID_SQL,
                     {"partner_id": partner_id}
                 ).fetchone()
                 
@@ -2159,12 +2080,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                         if not product_name:
                             raise ValueError("ERR-IVD-VALUE")
                         
-                        product_insert_query = text("""
-                            INSERT INTO products (partner_id, product_name, created_at)
-                            VALUES (:partner_id, :product_name, :created_at)
-                        """)
                         product_result = session.execute(
-                            product_insert_query,
+                            _INSERT_PRODUCT_SQL,
                             {
                                 "partner_id": partner_id,
                                 "product_name": product_name,
@@ -2178,12 +2095,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                             raise ValueError("ERR-IVD-VALUE")
                         
                         # 상품 존재 및 파트너 소유 확인
-                        check_query = text("""
-                            SELECT product_id FROM products 
-                            WHERE product_id = :product_id AND partner_id = :partner_id
-                        """)
                         check_result = session.execute(
-                            check_query,
+                            _FIND_PARTNER_PRODUCT_SQL,
                             {
                                 "product_id": product_id,
                                 "partner_id": partner_id,
@@ -2201,18 +2114,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                     })
                 
                 # 3. IssueLog 생성 (상태는 바로 ISSUED)
-                issue_query = text("""
-                    INSERT INTO issue_logs (
-                        title, product_kind_count, requested_issue_count, approved_issue_count,
-                        requested_at, decided_at, valid_days, status, vendor_id, partner_id, created_at
-                    )
-                    VALUES (
-                        :title, :product_kind_count, :approved_issue_count, :approved_issue_count,
-                        :now, :now, :valid_days, 'ISSUE_STATUS/ISSUED', NULL, :partner_id, :created_at
-                    )
-                """)
                 result = session.execute(
-                    issue_query,
+                    _INSERT_SELF_ISSUE_SQL,
                     {
                         "title": title,
                         "product_kind_count": product_kind_count,
@@ -2233,15 +2136,12 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                     count = product_info["count"]
                     
                     # IssueProduct 생성 (stage는 APPROVE)
-                    issue_product_query = text("""
-                        INSERT INTO issue_products (issue_id, product_id, product_name, stage, count, created_at)
-                        VALUES (:issue_id, :product_id, NULL, 'APPROVE', :count, :created_at)
-                    """)
                     session.execute(
-                        issue_product_query,
+                        _INSERT_APPROVED_ISSUE_PRODUCT_SQL,
                         {
                             "issue_id": issue_id,
                             "product_id": final_product_id,
+                            "product_name": None,
                             "count": count,
                             "created_at": now,
                         }
@@ -2253,27 +2153,14 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                         registration_code = ''.join([str(random.randint(0, 9)) for _ in range(10)])
                         
                         # 중복 확인 (매우 드물지만)
-                        check_code_query = text("""
-                            SELECT coupon_id FROM coupons WHERE registration_code = :registration_code
-                        """)
                         while session.execute(
-                            check_code_query,
+                            _FIND_COUPON_ID_BY_REGISTRATION_CODE_SQL,
                             {"registration_code": registration_code}
                         ).fetchone():
                             registration_code = ''.join([str(random.randint(0, 9)) for _ in range(10)])
                         
-                        coupon_insert_query = text("""
-                            INSERT INTO coupons (
-                                issue_id, product_id, registration_code, partner_id,
-                                created_at, expired_at
-                            )
-                            VALUES (
-                                :issue_id, :product_id, :registration_code, :partner_id,
-                                :created_at, :expired_at
-                            )
-                        """)
                         session.execute(
-                            coupon_insert_query,
+                            _INSERT_ISSUED_COUPON_SQL,
                             {
                                 "issue_id": issue_id,
                                 "product_id": final_product_id,
@@ -2310,43 +2197,23 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _query():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 now = now_kst()
                 
-                query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        p.product_name,
-                        m.member_name as vendor_name,
-                        DATE_FORMAT(c.created_at, '%Y-%m-%d %H:%i:%s') as created_at,
-                        DATE_FORMAT(c.expired_at, '%Y-%m-%d %H:%i:%s') as expired_at,
-                        c.use_log_id
-                    FROM payment_qr_codes pqr
-                    INNER JOIN coupons c ON pqr.coupon_id = c.coupon_id
-                    INNER JOIN products p ON c.product_id = p.product_id
-                    INNER JOIN issue_logs il ON c.issue_id = il.issue_id
-                    INNER JOIN members m ON il.vendor_id = m.member_id
-                    WHERE pqr.payment_code = :payment_code
-                      AND pqr.expired_at > :now
-                    LIMIT 1
-                """)
-                
                 result = session.execute(
-                    query,
+                    _FIND_COUPON_BY_PAYMENT_CODE_SQL,
                     {"payment_code": payment_code, "now": now}
-                ).fetchone()
+                ).mappings().first()
                 
                 if result is None:
                     return None
                 
                 return {
-                    "coupon_id": result[0],
-                    "product_name": result[1],
-                    "vendor_name": result[2],
-                    "created_at": result[3],
-                    "expired_at": result[4],
-                    "use_log_id": result[5],
+                    "coupon_id": result["coupon_id"],
+                    "product_name": result["product_name"],
+                    "vendor_name": result["vendor_name"],
+                    "created_at": _format_datetime(result["created_at"]),
+                    "expired_at": _format_datetime(result["expired_at"]),
+                    "use_log_id": result["use_log_id"],
                 }
         
         return await self._run_in_thread(_query)
@@ -2367,25 +2234,11 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _confirm():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 now = now_kst()
                 
                 # 1. 결제코드로 쿠폰 조회 (유효기간 확인 포함)
-                coupon_query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        c.issue_id,
-                        c.use_log_id
-                    FROM payment_qr_codes pqr
-                    INNER JOIN coupons c ON pqr.coupon_id = c.coupon_id
-                    WHERE pqr.payment_code = :payment_code
-                      AND pqr.expired_at > :now
-                    LIMIT 1
-                """)
-                
                 coupon_result = session.execute(
-                    coupon_query,
+                    _FIND_PAYMENT_TARGET_SQL,
                     {"payment_code": payment_code, "now": now}
                 ).fetchone()
                 
@@ -2399,12 +2252,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                     raise ValueError("ERR-ALREADY-USED")
                 
                 # 3. use_logs에 레코드 생성
-                use_log_insert_query = text("""
-                    INSERT INTO use_logs (coupon_id, used_at, created_at, updated_at)
-                    VALUES (:coupon_id, :used_at, :created_at, :updated_at)
-                """)
                 use_log_result = session.execute(
-                    use_log_insert_query,
+                    _INSERT_USE_LOG_SQL,
                     {
                         "coupon_id": coupon_id,
                         "used_at": now,
@@ -2415,13 +2264,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 use_log_id = use_log_result.lastrowid
                 
                 # 4. coupons의 use_log_id 업데이트
-                coupon_update_query = text("""
-                    UPDATE coupons
-                    SET use_log_id = :use_log_id
-                    WHERE coupon_id = :coupon_id
-                """)
                 session.execute(
-                    coupon_update_query,
+                    _MARK_COUPON_USED_SQL,
                     {
                         "coupon_id": coupon_id,
                         "use_log_id": use_log_id,
@@ -2429,16 +2273,8 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 )
                 
                 # 5. 해당 issue_id의 모든 쿠폰이 결제되었는지 확인
-                check_all_used_query = text("""
-                    SELECT 
-                        COUNT(*) as total_count,
-                        SUM(CASE WHEN use_log_id IS NOT NULL THEN 1 ELSE 0 END) as used_count
-                    FROM coupons
-                    WHERE issue_id = :issue_id
-                """)
-                
                 check_result = session.execute(
-                    check_all_used_query,
+                    _COUNT_ISSUE_COUPONS_USED_SQL,
                     {"issue_id": issue_id}
                 ).fetchone()
                 
@@ -2447,20 +2283,16 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
                 # 6. 모든 쿠폰이 결제되었으면 issue_logs의 status를 'ISSUE_STATUS/COMPLETED'로 변경
                 if total_count > 0 and used_count == total_count:
                     # 현재 상태가 ISSUED, SHARED인 경우에만 COMPLETED로 변경
-                    issue_update_query = text("""
-                        UPDATE issue_logs
-                        SET status = 'ISSUE_STATUS/COMPLETED'
-                        WHERE issue_id = :issue_id
-                          AND status IN ('ISSUE_STATUS/ISSUED', 'ISSUE_STATUS/SHARED')
-                    """)
                     session.execute(
-                        issue_update_query,
+                        _COMPLETE_ISSUE_SQL,
                         {"issue_id": issue_id}
                     )
                 
                 session.commit()
+                return coupon_id
         
-        return await self._run_in_thread(_confirm)
+        coupon_id = await self._run_in_thread(_confirm)
+        self._invalidate_coupon_detail([coupon_id])
     
     async def find_coupon_by_id_for_payment_qr(
         self,
@@ -2472,35 +2304,20 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """
         def _query():
             with self._session_factory() as session:
-                query = text("""
-                    SELECT 
-                        c.coupon_id,
-                        c.registration_code,
-                        c.register_id,
-                        c.use_log_id,
-                        DATE_FORMAT(c.expired_at, '%Y-%m-%d %H:%i:%s') as expired_at
-                    FROM coupons c
-                    LEFT JOIN register_logs rl ON c.register_log_id = rl.register_log_id
-                    WHERE c.coupon_id = :coupon_id
-                      AND c.register_id = :member_id
-                      AND (rl.deleted_at IS NULL OR rl.register_log_id IS NULL)
-                    LIMIT 1
-                """)
-                
                 result = session.execute(
-                    query,
+                    _FIND_COUPON_FOR_PAYMENT_QR_SQL,
                     {"coupon_id": coupon_id, "member_id": member_id}
-                ).fetchone()
+                ).mappings().first()
                 
                 if result is None:
                     return None
                 
                 return {
-                    "coupon_id": result[0],
-                    "registration_code": result[1],
-                    "register_id": result[2],
-                    "use_log_id": result[3],
-                    "expired_at": result[4],
+                    "coupon_id": result["coupon_id"],
+                    "registration_code": result["registration_code"],
+                    "register_id": result["register_id"],
+                    "use_log_id": result["use_log_id"],
+                    "expired_at": _format_datetime(result["expired_at"]),
                 }
         
         return await self._run_in_thread(_query)
@@ -2512,20 +2329,11 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """특정 쿠폰의 모든 활성 QR 코드를 만료 처리합니다."""
         def _expire():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 now = now_kst()
                 
                 # 만료 시간을 현재 시간 이전으로 설정하여 만료 처리
-                expire_query = text("""
-                    UPDATE payment_qr_codes
-                    SET expired_at = :now
-                    WHERE coupon_id = :coupon_id
-                      AND expired_at > :now
-                """)
-                
                 session.execute(
-                    expire_query,
+                    _EXPIRE_PAYMENT_QRS_SQL,
                     {"coupon_id": coupon_id, "now": now}
                 )
                 
@@ -2542,17 +2350,10 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """결제 QR 코드를 생성합니다."""
         def _create():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 now = now_kst()
                 
-                insert_query = text("""
-                    INSERT INTO payment_qr_codes (coupon_id, payment_code, expired_at, created_at, updated_at)
-                    VALUES (:coupon_id, :payment_code, :expired_at, :created_at, :updated_at)
-                """)
-                
                 result = session.execute(
-                    insert_query,
+                    _INSERT_PAYMENT_QR_SQL,
                     {
                         "coupon_id": coupon_id,
                         "payment_code": payment_code,
@@ -2574,34 +2375,20 @@ class SQLAlchemyCouponRepository(_SQLRepositoryBase):
         """활성 결제 QR 코드를 조회합니다."""
         def _query():
             with self._session_factory() as session:
-                from libs.common import now_kst
-                
                 now = now_kst()
                 
-                query = text("""
-                    SELECT 
-                        payment_qr_id,
-                        payment_code,
-                        DATE_FORMAT(expired_at, '%Y-%m-%d %H:%i:%s') as expired_at
-                    FROM payment_qr_codes
-                    WHERE coupon_id = :coupon_id
-                      AND expired_at > :now
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """)
-                
                 result = session.execute(
-                    query,
+                    _FIND_ACTIVE_PAYMENT_QR_SQL,
                     {"coupon_id": coupon_id, "now": now}
-                ).fetchone()
+                ).mappings().first()
                 
                 if result is None:
                     return None
                 
                 return {
-                    "payment_qr_id": result[0],
-                    "payment_code": result[1],
-                    "expired_at": result[2],
+                    "payment_qr_id": result["payment_qr_id"],
+                    "payment_code": result["payment_code"],
+                    "expired_at": _format_datetime(result["expired_at"]),
                 }
         
         return await self._run_in_thread(_query)
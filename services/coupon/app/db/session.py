@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from sqlalchemy import create_engine
@@ -8,13 +9,27 @@ from services.coupon.app.db.connection import settings
 
 engine = create_engine(
     settings.COUPON_DATABASE_URL,
+    pool_size=settings.COUPON_DB_POOL_SIZE,
+    max_overflow=settings.COUPON_DB_MAX_OVERFLOW,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=settings.COUPON_DB_POOL_RECYCLE,
+    isolation_level=settings.COUPON_DB_ISOLATION_LEVEL,
     future=True,
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
+# 목록/검색 조회 전용 세션: 같은 커넥션 풀을 쓰되 체크아웃 동안만 격리 수준을 바꾸고 반납 시 기본값으로 되돌림
+read_engine = engine.execution_options(isolation_level=settings.COUPON_DB_READ_ISOLATION_LEVEL)
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, expire_on_commit=False)
+
+# DB 작업 전용 스레드 풀
+# asyncio 기본 실행기를 다른 작업과 공유하지 않고, 스레드 수를 커넥션 풀 한도에 맞춰 체크아웃 대기를 방지
+db_executor = ThreadPoolExecutor(
+    max_workers=settings.COUPON_DB_POOL_SIZE + settings.COUPON_DB_MAX_OVERFLOW,
+    thread_name_prefix="coupon-db",
+)
+
 
 @contextmanager
 def session_scope():
@@ -24,3 +39,13 @@ def session_scope():
     finally:
         session.close()
 
+
+@contextmanager
+def read_session_scope():
+    """쓰기가 없는 목록/검색 조회용 세션"""
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
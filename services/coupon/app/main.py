@@ -48,6 +48,7 @@ app.add_middleware(
     allow_credentials=True,  # 쿠키를 포함한 요청 허용
     allow_methods=["*"],  # 모든 HTTP 메서드 허용 (GET, POST, PUT, DELETE 등)
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["NEXT-CURSOR"],  # 목록 API의 다음 페이지 커서를 브라우저에서 읽을 수 있도록 노출
 )
 
 app.include_router(router)
@@ -0,0 +1,11 @@
+from fastapi_pagination import Page
+from fastapi_pagination.customization import CustomizedPage, UseName, UseOptionalFields
+
+
+# 커서(keyset) 페이지네이션을 지원하는 목록 응답
+# 커서로 조회한 페이지는 전체 개수/페이지 번호를 다시 집계하지 않으므로 total, page, pages가 null
+KeysetPage = CustomizedPage[
+    Page,
+    UseName("KeysetPage"),
+    UseOptionalFields(fields=["total", "page", "pages"]),
+]
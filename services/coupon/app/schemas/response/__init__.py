@@ -1,4 +1,5 @@
 from services.coupon.app.schemas.response.CouponAddResponse import CouponAddResponse
+from services.coupon.app.schemas.response.KeysetPage import KeysetPage
 from services.coupon.app.schemas.response.CouponListResponse import CouponListItem
 from services.coupon.app.schemas.response.CouponDetailResponse import (
     CouponDetailResponse,
@@ -46,6 +47,7 @@ from services.coupon.app.schemas.response.PaymentQrResponse import (
 
 __all__ = [
     "CouponAddResponse",
+    "KeysetPage",
     "CouponListItem",
     "CouponDetailResponse",
     "PartnerInfo",
@@ -0,0 +1,117 @@
+"""
+쿠폰/결제 로그 목록 커서 토큰 테스트
+"""
+import base64
+import unittest
+from datetime import datetime
+
+from services.coupon.app.core.CouponService import CouponService, _decode_cursor, _encode_cursor
+
+
+def _raw_token(raw: str) -> str:
+    """임의 문자열로 커서 토큰을 생성합니다 (패딩 제거)."""
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+class CursorTokenTest(unittest.TestCase):
+    def test_round_trip(self):
+        keyset = (datetime(2026, 1, 2, 3, 4, 5), 42)
+        self.assertEqual(_decode_cursor(_encode_cursor(keyset)), keyset)
+
+    def test_round_trip_keeps_microseconds(self):
+        keyset = (datetime(2026, 1, 2, 3, 4, 5, 678901), 7)
+        self.assertEqual(_decode_cursor(_encode_cursor(keyset)), keyset)
+
+    def test_token_is_url_safe_without_padding(self):
+        token = _encode_cursor((datetime(2026, 1, 2, 3, 4, 5), 1))
+        self.assertNotIn("=", token)
+        self.assertNotIn("+", token)
+        self.assertNotIn("/", token)
+
+    def test_malformed_base64(self):
+        for token in ["!!!", "a", "%%%%"]:
+            with self.subTest(token=token):
+                with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+                    _decode_cursor(token)
+
+    def test_non_utf8_payload(self):
+        token = base64.urlsafe_b64encode(b"\xff\xfe|1").decode()
+        with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+            _decode_cursor(token)
+
+    def test_wrong_field_count(self):
+        for raw in ["2026-01-02T03:04:05", "2026-01-02T03:04:05|1|25", ""]:
+            with self.subTest(raw=raw):
+                with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+                    _decode_cursor(_raw_token(raw))
+
+    def test_invalid_field_values(self):
+        for raw in ["not-a-date|1", "2026-01-02T03:04:05|abc"]:
+            with self.subTest(raw=raw):
+                with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+                    _decode_cursor(_raw_token(raw))
+
+    def test_legacy_total_field_is_rejected(self):
+        # 전체 개수(음수 포함)를 담던 이전 형식은 더 이상 받지 않음
+        with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+            _decode_cursor(_raw_token("2026-01-02 03:04:05|1|-5"))
+
+
+class _FakeListRepository:
+    """목록 조회만 흉내 내는 Repository (전달받은 커서를 기록)"""
+
+    def __init__(self, next_keyset=None):
+        self.next_keyset = next_keyset
+        self.cursors = []
+
+    async def find_coupons_by_member_id(self, member_id, page, size, cursor=None):
+        self.cursors.append(cursor)
+        return ([], None if cursor is not None else 0, self.next_keyset)
+
+    async def find_payment_logs_by_member_id(self, member_id, page, size, cursor=None):
+        self.cursors.append(cursor)
+        return ([], None if cursor is not None else 0, self.next_keyset)
+
+
+class CursorListServiceTest(unittest.IsolatedAsyncioTestCase):
+    async def test_invalid_cursor_raises_before_query(self):
+        repository = _FakeListRepository()
+        service = CouponService(repository)
+        for method in (service.get_coupons_by_member, service.get_payment_logs_by_member):
+            with self.subTest(method=method.__name__):
+                with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+                    await method(member_id=1, page=1, size=10, cursor="!!!")
+        self.assertEqual(repository.cursors, [])
+
+    async def test_cursor_is_passed_as_keyset(self):
+        keyset = (datetime(2026, 1, 2, 3, 4, 5), 42)
+        repository = _FakeListRepository()
+        service = CouponService(repository)
+        await service.get_coupons_by_member(member_id=1, page=1, size=10, cursor=_encode_cursor(keyset))
+        await service.get_payment_logs_by_member(member_id=1, page=1, size=10, cursor=_encode_cursor(keyset))
+        self.assertEqual(repository.cursors, [keyset, keyset])
+
+    async def test_cursor_page_omits_total_and_page(self):
+        service = CouponService(_FakeListRepository())
+        cursor = _encode_cursor((datetime(2026, 1, 2, 3, 4, 5), 42))
+        result, _ = await service.get_coupons_by_member(member_id=1, page=3, size=10, cursor=cursor)
+        self.assertIsNone(result.total)
+        self.assertIsNone(result.page)
+        self.assertIsNone(result.pages)
+
+    async def test_next_cursor_from_repository_keyset(self):
+        keyset = (datetime(2026, 1, 2, 3, 4, 5, 678901), 9)
+        service = CouponService(_FakeListRepository(next_keyset=keyset))
+        _, next_cursor = await service.get_payment_logs_by_member(member_id=1, page=1, size=10)
+        self.assertEqual(_decode_cursor(next_cursor), keyset)
+
+    async def test_last_page_has_no_next_cursor(self):
+        service = CouponService(_FakeListRepository(next_keyset=None))
+        result, next_cursor = await service.get_coupons_by_member(member_id=1, page=1, size=10)
+        self.assertIsNone(next_cursor)
+        self.assertEqual(result.total, 0)
+        self.assertEqual(result.page, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
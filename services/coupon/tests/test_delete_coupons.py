@@ -0,0 +1,74 @@
+"""
+쿠폰 삭제 (소유권 검증 결과에 따른 오류 분기) 테스트
+"""
+import unittest
+
+from services.coupon.app.core.CouponService import CouponService
+
+
+def _unused_coupon(coupon_id: int) -> dict:
+    """Repository가 반환하는 삭제된 미사용 쿠폰 상세 정보"""
+    return {
+        "coupon_id": coupon_id,
+        "register_log_id": 100 + coupon_id,
+        "product_name": "아메리카노",
+        "partner_id": 7,
+        "partner_name": "카페",
+        "partner_phones": ["01012345678"],
+        "member_id": 1,
+        "member_name": "홍길동",
+        "member_birth": "2000-01-01",
+        "created_at": "2026-01-01 00:00:00",
+        "expired_at": "2026-02-01 00:00:00",
+        "registered_at": "2026-01-02 00:00:00",
+    }
+
+
+class _FakeDeleteRepository:
+    """mark_coupons_as_deleted 결과를 고정해 두고 호출 인자를 기록하는 Repository"""
+
+    def __init__(self, result: tuple[list[dict], int]):
+        self.result = result
+        self.calls = []
+
+    async def mark_coupons_as_deleted(self, coupon_ids, member_id):
+        self.calls.append((coupon_ids, member_id))
+        return self.result
+
+
+class DeleteCouponsTest(unittest.IsolatedAsyncioTestCase):
+    async def test_all_invalid(self):
+        service = CouponService(_FakeDeleteRepository(([], 2)))
+        with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+            await service.delete_coupons(coupon_ids=[1, 2], member_id=1)
+
+    async def test_partially_invalid(self):
+        service = CouponService(_FakeDeleteRepository(([], 1)))
+        with self.assertRaisesRegex(ValueError, "^ERR-NOT-YOURS$"):
+            await service.delete_coupons(coupon_ids=[1, 2], member_id=1)
+
+    async def test_duplicate_ids_all_invalid(self):
+        # 유효하지 않은 개수는 중복을 제거한 ID 기준 (2개 중 2개 무효)
+        service = CouponService(_FakeDeleteRepository(([], 2)))
+        with self.assertRaisesRegex(ValueError, "^ERR-IVD-VALUE$"):
+            await service.delete_coupons(coupon_ids=[1, 1, 2, 2], member_id=1)
+
+    async def test_duplicate_ids_partially_invalid(self):
+        # 중복을 포함한 요청 길이(3)가 아니라 고유 ID 수(2)와 비교해야 함
+        service = CouponService(_FakeDeleteRepository(([], 1)))
+        with self.assertRaisesRegex(ValueError, "^ERR-NOT-YOURS$"):
+            await service.delete_coupons(coupon_ids=[1, 1, 2], member_id=1)
+
+    async def test_all_valid_returns_unused_coupons(self):
+        repository = _FakeDeleteRepository(([_unused_coupon(2)], 0))
+        service = CouponService(repository)
+        deleted = await service.delete_coupons(coupon_ids=[1, 2, 2], member_id=1)
+        self.assertEqual(repository.calls, [([1, 2, 2], 1)])
+        self.assertEqual([coupon.id for coupon in deleted], [2])
+        self.assertFalse(deleted[0].isUsed)
+        self.assertEqual(deleted[0].registerLog.registerLogId, 102)
+        self.assertEqual(deleted[0].partner.phones, ["01012345678"])
+
+
+if __name__ == "__main__":
+    unittest.main()